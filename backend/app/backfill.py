@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import json
+import os
+from pathlib import Path
+import re
+import time
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from app.scraper import HACKERONE_HACKTIVITY_URL, dedupe_items, filter_recent_items, parse_bodies
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+MEDIUM_ARCHIVE_URL = "https://medium.com/tag/bug-bounty/archive/{day:%Y/%m/%d}"
+PORTSWIGGER_INDEX_URL = "https://portswigger.net/research/articles"
+BACKFILL_SOURCES = ("medium", "portswigger", "hackerone")
+
+Fetch = Callable[[str], str]
+
+# JSON:API pagination links are a flat object; reading them with a regex keeps the
+# parent from decoding whole hacktivity pages that a parse worker decodes anyway.
+_LINKS_RE = re.compile(r'"links"\s*:\s*(\{[^{}]*\})')
+
+
+@dataclass
+class Page:
+    job: tuple
+    # Where to resume after this page has been stored; None once the source is exhausted.
+    next_cursor: str | None
+    # Pages are ordered newest first, so a page entirely before `since` ends the walk.
+    newest_first: bool = False
+
+
+def _medium_pages(cursor: str | None, since: datetime, until: datetime, fetch: Fetch) -> Iterator[Page]:
+    day = datetime.fromisoformat(cursor) if cursor else since.replace(hour=0, minute=0, second=0, microsecond=0)
+    while day <= until:
+        body = fetch(MEDIUM_ARCHIVE_URL.format(day=day))
+        next_day = day + timedelta(days=1)
+        yield Page(("html", "medium", body, day.isoformat()), next_day.isoformat() if next_day <= until else None)
+        day = next_day
+
+
+def _portswigger_pages(cursor: str | None, since: datetime, until: datetime, fetch: Fetch) -> Iterator[Page]:
+    yield Page(("html", "portswigger", fetch(PORTSWIGGER_INDEX_URL)), None)
+
+
+def _hackerone_pages(cursor: str | None, since: datetime, until: datetime, fetch: Fetch) -> Iterator[Page]:
+    url: str | None = cursor or HACKERONE_HACKTIVITY_URL
+    while url:
+        body = fetch(url)
+        next_url = _hackerone_next_link(body)
+        yield Page(("hackerone", "hackerone", body), next_url, newest_first=True)
+        url = next_url
+
+
+def _hackerone_next_link(body: str) -> str | None:
+    # Only the document-level links object carries "next"; item-level ones just point at themselves.
+    for raw_links in reversed(_LINKS_RE.findall(body)):
+        try:
+            next_url = json.loads(raw_links).get("next")
+        except ValueError:
+            continue
+        if next_url:
+            return next_url
+    return None
+
+
+PAGE_WALKERS: dict[str, Callable[[str | None, datetime, datetime, Fetch], Iterator[Page]]] = {
+    "medium": _medium_pages,
+    "portswigger": _portswigger_pages,
+    "hackerone": _hackerone_pages,
+}
+
+
+class CheckpointStore:
+    """Per-source resume cursors for one backfill range, persisted as JSON after every update."""
+
+    def __init__(self, path: Path, since: datetime, until: datetime) -> None:
+        self.path = path
+        self.range = [since.isoformat(), until.isoformat()]
+        self.sources: dict[str, dict] = {}
+        if path.exists():
+            state = json.loads(path.read_text(encoding="utf-8"))
+            if state.get("range") == self.range:
+                self.sources = state.get("sources") or {}
+            else:
+                print(f"[warn] ignoring checkpoint {path}: it was written for range {state.get('range')}")
+
+    def state(self, source: str) -> dict:
+        return self.sources.setdefault(source, {"cursor": None, "done": False, "pages": 0, "upserted": 0})
+
+    def advance(self, source: str, next_cursor: str | None, pages: int, upserted: int, done: bool = False) -> None:
+        state = self.state(source)
+        state["cursor"] = next_cursor
+        state["done"] = done or next_cursor is None
+        state["pages"] += pages
+        state["upserted"] += upserted
+        self.save()
+
+    def save(self) -> None:
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps({"range": self.range, "sources": self.sources}, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+def run_backfill(
+    store: CheckpointStore,
+    since: datetime,
+    until: datetime,
+    fetchers: dict[str, Fetch],
+    upsert: Callable[[list[dict]], int],
+    delay_seconds: float = 1.0,
+    workers: int = 1,
+    max_pages: int | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict[str, int]:
+    """Walk each source's history between ``since`` and ``until``, resuming from ``store``.
+
+    Pages are fetched ``delay_seconds`` apart, parsed ``workers`` at a time, and
+    upserted before the checkpoint advances, so a restart never skips a page.
+    """
+    upserted_by_source: dict[str, int] = {}
+    for source, fetch in fetchers.items():
+        state = store.state(source)
+        upserted_by_source[source] = 0
+        if state["done"]:
+            print(f"[backfill] source={source} already complete, skipping")
+            continue
+
+        try:
+            upserted_by_source[source] = _backfill_source(
+                store, source, since, until, fetch, upsert, delay_seconds, workers, max_pages, sleep
+            )
+        except Exception as exc:
+            print(f"[warn] backfill stopped for source={source}, will resume from checkpoint: {exc}")
+
+    return upserted_by_source
+
+
+def _parse_pool(workers: int) -> AbstractContextManager[Executor | None]:
+    if workers <= 1:
+        return nullcontext()
+    # Imported here for the same reason as in parse_bodies: only multi-worker runs need it.
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _backfill_source(
+    store: CheckpointStore,
+    source: str,
+    since: datetime,
+    until: datetime,
+    fetch: Fetch,
+    upsert: Callable[[list[dict]], int],
+    delay_seconds: float,
+    workers: int,
+    max_pages: int | None,
+    sleep: Callable[[float], None],
+) -> int:
+    pages = PAGE_WALKERS[source](store.state(source)["cursor"], since, until, fetch)
+    total = 0
+    fetched = 0
+    # One pool for the whole walk rather than one per batch of pages.
+    with _parse_pool(workers) as pool:
+        while max_pages is None or fetched < max_pages:
+            batch: list[Page] = []
+            for page in pages:
+                batch.append(page)
+                fetched += 1
+                if len(batch) >= max(workers, 1) or (max_pages is not None and fetched >= max_pages):
+                    break
+                sleep(delay_seconds)
+            if not batch:
+                break
+
+            parsed = list(parse_bodies([page.job for page in batch], workers=workers, pool=pool))
+            in_range = [
+                item
+                for item in dedupe_items(filter_recent_items(parsed, min_date=since))
+                if item["published_at"] <= until
+            ]
+            count = upsert(in_range) if in_range else 0
+            exhausted = batch[-1].newest_first and bool(parsed) and not filter_recent_items(parsed, min_date=since)
+            store.advance(source, batch[-1].next_cursor, pages=len(batch), upserted=count, done=exhausted)
+            total += count
+            print(f"[backfill] source={source} pages={len(batch)} upserted={count} cursor={batch[-1].next_cursor}")
+            if store.state(source)["done"]:
+                break
+            sleep(delay_seconds)
+
+    return total
+
+
+def parse_backfill_date(raw: str) -> datetime:
+    value = datetime.fromisoformat(raw)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+
+@dataclass
+class _Entry:
+    value: Any
+    stored_at: float
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlightCache:
+    """Shares one in-flight load per key and serves stale entries while refreshing.
+
+    Entries younger than ``ttl_seconds`` are returned as-is. Entries within the
+    following ``stale_seconds`` are returned immediately while a single background
+    refresh runs. Older or missing entries block on one shared load per key.
+    At most ``max_entries`` keys are kept, evicting the least recently used.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._flights: dict[Hashable, _Flight] = {}
+        self._generation = 0
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = self._clock() - entry.stored_at
+                if age < self.ttl_seconds + self.stale_seconds:
+                    self._entries.move_to_end(key)
+                if age < self.ttl_seconds:
+                    return entry.value
+                if age < self.ttl_seconds + self.stale_seconds:
+                    if key not in self._flights:
+                        flight = self._flights[key] = _Flight()
+                        threading.Thread(
+                            target=self._run,
+                            args=(key, loader, flight, self._generation),
+                            daemon=True,
+                        ).start()
+                    return entry.value
+
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            generation = self._generation
+
+        if leader:
+            self._run(key, loader, flight, generation)
+        else:
+            flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._flights.clear()
+            self._generation += 1
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        now = self._clock()
+        max_age = self.ttl_seconds + self.stale_seconds
+        for expired in [k for k, entry in self._entries.items() if now - entry.stored_at >= max_age]:
+            del self._entries[expired]
+        self._entries[key] = _Entry(value, now)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _run(self, key: Hashable, loader: Callable[[], Any], flight: _Flight, generation: int) -> None:
+        try:
+            flight.value = loader()
+        except Exception as exc:
+            flight.error = exc
+        with self._lock:
+            if flight.error is None and generation == self._generation and self.ttl_seconds + self.stale_seconds > 0:
+                self._store(key, flight.value)
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.done.set()
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import os
 from pathlib import Path
+from typing import Any
 
 
 def _load_backend_env_file() -> None:
@@ -20,19 +22,58 @@ def _load_backend_env_file() -> None:
         os.environ.setdefault(key, value)
 
 
-_load_backend_env_file()
+def _env(name: str, default: str) -> Any:
+    return field(default_factory=lambda: os.getenv(name) or default)
+
+
+def _env_float(name: str, default: float) -> Any:
+    return field(default_factory=lambda: float(os.getenv(name) or default))
+
+
+def _env_int(name: str, default: int) -> Any:
+    return field(default_factory=lambda: int(os.getenv(name) or default))
+
+
+def _env_bool(name: str, default: bool) -> Any:
+    return field(default_factory=lambda: (os.getenv(name) or str(default)).strip().lower() in {"1", "true", "yes", "on"})
 
 
 @dataclass(frozen=True)
 class Settings:
-    supabase_url: str = os.getenv("SUPABASE_URL", "")
-    supabase_service_key: str = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
-    telegram_bot_token: str = os.getenv("TELEGRAM_BOT_TOKEN", "")
-    telegram_chat_id: str = os.getenv("TELEGRAM_CHAT_ID", "")
-    discord_webhook_url: str = os.getenv("DISCORD_WEBHOOK_URL", "")
-    hackerone_username: str = os.getenv("HACKERONE_USERNAME", "")
-    hackerone_api_token: str = os.getenv("HACKERONE_API_TOKEN", "")
-    min_date: str = os.getenv("MIN_PUBLISHED_DATE", "2025-01-01T00:00:00+00:00")
+    supabase_url: str = _env("SUPABASE_URL", "")
+    supabase_service_key: str = _env("SUPABASE_SERVICE_ROLE_KEY", "")
+    telegram_bot_token: str = _env("TELEGRAM_BOT_TOKEN", "")
+    telegram_chat_id: str = _env("TELEGRAM_CHAT_ID", "")
+    discord_webhook_url: str = _env("DISCORD_WEBHOOK_URL", "")
+    hackerone_username: str = _env("HACKERONE_USERNAME", "")
+    hackerone_api_token: str = _env("HACKERONE_API_TOKEN", "")
+    min_date: str = _env("MIN_PUBLISHED_DATE", "2025-01-01T00:00:00+00:00")
+    list_cache_ttl_seconds: float = _env_float("LIST_CACHE_TTL_SECONDS", 30)
+    list_cache_stale_seconds: float = _env_float("LIST_CACHE_STALE_SECONDS", 300)
+    list_cache_max_entries: int = _env_int("LIST_CACHE_MAX_ENTRIES", 256)
+    parse_workers: int = _env_int("PARSE_WORKERS", 1)
+    enrich_articles: bool = _env_bool("ENRICH_ARTICLES", False)
+    enrich_concurrency: int = _env_int("ENRICH_CONCURRENCY", 8)
+    enrich_per_host: int = _env_int("ENRICH_PER_HOST", 2)
+    enrich_cache_dir: str = _env("ENRICH_CACHE_DIR", str(Path(__file__).resolve().parents[1] / ".enrich-cache"))
+    events_publish_url: str = _env("EVENTS_PUBLISH_URL", "")
+    events_publish_token: str = _env("EVENTS_PUBLISH_TOKEN", "")
+    events_buffer_size: int = _env_int("EVENTS_BUFFER_SIZE", 32)
+    events_heartbeat_seconds: float = _env_float("EVENTS_HEARTBEAT_SECONDS", 15)
+    fetch_retry_budget: int = _env_int("FETCH_RETRY_BUDGET", 20)
+    fetch_breaker_threshold: int = _env_int("FETCH_BREAKER_THRESHOLD", 3)
+    fetch_breaker_cooldown_seconds: float = _env_float("FETCH_BREAKER_COOLDOWN_SECONDS", 20 * 3600)
+    fetch_state_path: str = _env("FETCH_STATE_PATH", str(Path(__file__).resolve().parents[1] / ".fetch-breakers.json"))
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    _load_backend_env_file()
+    return Settings()
 
 
-settings = Settings()
+def __getattr__(name: str) -> Any:
+    # `settings` is built on first access so importing this module stays free of file I/O.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import hashlib
+from html.parser import HTMLParser
+import math
+import os
+from pathlib import Path
+import threading
+from typing import Callable, Iterable
+from urllib.parse import urlsplit
+
+WORDS_PER_MINUTE = 200
+MAX_CONTENT_CHARS = 20_000
+MAX_TAGS = 10
+_SKIPPED_TAGS = {"script", "style", "noscript", "nav", "header", "footer", "aside", "svg", "form"}
+_BLOCK_TAGS = {"p", "div", "br", "li", "h1", "h2", "h3", "h4", "h5", "h6", "pre", "blockquote", "section", "article"}
+
+
+class _ArticleParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.body_parts: list[str] = []
+        self.article_parts: list[str] = []
+        self.tags: list[str] = []
+        self._skip_depth = 0
+        self._article_depth = 0
+        self._tag_link_text: list[str] | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        values = dict(attrs)
+        if tag == "meta":
+            key = (values.get("property") or values.get("name") or "").lower()
+            content = (values.get("content") or "").strip()
+            if key == "article:tag" and content:
+                self.tags.append(content)
+            elif key == "keywords" and content:
+                self.tags.extend(part.strip() for part in content.split(","))
+        elif tag == "a" and ("tag" in (values.get("rel") or "").split() or "/tag/" in (values.get("href") or "")):
+            self._tag_link_text = []
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "article":
+            self._article_depth += 1
+        if tag in _BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "a" and self._tag_link_text is not None:
+            self.tags.append(" ".join("".join(self._tag_link_text).split()))
+            self._tag_link_text = None
+        if tag in _SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "article" and self._article_depth:
+            self._article_depth -= 1
+        if tag in _BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if self._tag_link_text is not None:
+            self._tag_link_text.append(data)
+        if not self._skip_depth:
+            self._append(data)
+
+    def _append(self, text: str) -> None:
+        self.body_parts.append(text)
+        if self._article_depth:
+            self.article_parts.append(text)
+
+
+def _clean_text(parts: list[str]) -> str:
+    lines = (" ".join(line.split()) for line in "".join(parts).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def extract_article(html: str) -> dict:
+    """Extract readable text, reading time and tags from an article page."""
+    parser = _ArticleParser()
+    parser.feed(html)
+    parser.close()
+
+    text = _clean_text(parser.article_parts) or _clean_text(parser.body_parts)
+    words = len(text.split())
+    tags: list[str] = []
+    for tag in parser.tags:
+        if tag and tag.lower() not in {existing.lower() for existing in tags}:
+            tags.append(tag)
+    return {
+        "content_text": text[:MAX_CONTENT_CHARS] or None,
+        "reading_time_minutes": max(1, math.ceil(words / WORDS_PER_MINUTE)) if words else None,
+        "tags": tags[:MAX_TAGS],
+    }
+
+
+class ContentCache:
+    """On-disk cache of fetched pages: bodies are stored once by SHA-256 and indexed by URL."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def _index_path(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.root / "urls" / digest[:2] / digest
+
+    def _blob_path(self, content_hash: str) -> Path:
+        return self.root / "blobs" / content_hash[:2] / content_hash
+
+    def get(self, url: str) -> str | None:
+        try:
+            content_hash = self._index_path(url).read_text(encoding="utf-8").strip()
+            return self._blob_path(content_hash).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def put(self, url: str, body: str) -> None:
+        content_hash = hashlib.sha256(body.encode("utf-8")).hexdigest()
+        blob_path = self._blob_path(content_hash)
+        if not blob_path.exists():
+            _write_atomic(blob_path, body)
+        _write_atomic(self._index_path(url), content_hash)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class _HostLimiter:
+    def __init__(self, per_host: int) -> None:
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+    def __call__(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return self._semaphores[host]
+
+
+def enrich_items(
+    items: Iterable[dict],
+    cache: ContentCache,
+    fetch: Callable[[str], str],
+    max_workers: int = 8,
+    per_host: int = 2,
+) -> dict[str, dict]:
+    """Fetch and extract each item's page, returning ``{url: enrichment}`` for the ones that succeeded.
+
+    At most ``max_workers`` pages are fetched at once and at most ``per_host`` per host;
+    pages already in ``cache`` are never refetched.
+    """
+    host_slot = _HostLimiter(per_host)
+
+    def enrich(url: str) -> tuple[str, dict | None]:
+        body = cache.get(url)
+        if body is None:
+            try:
+                with host_slot(url):
+                    body = fetch(url)
+            except Exception as exc:
+                print(f"[warn] failed enriching url={url}: {exc}")
+                return url, None
+            cache.put(url, body)
+        return url, extract_article(body)
+
+    urls = list(dict.fromkeys(item["url"] for item in items))
+    if not urls:
+        return {}
+    # Imported here so the daily script only loads concurrent.futures when enrichment is on.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as pool:
+        return {url: result for url, result in pool.map(enrich, urls) if result is not None}
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+
+class Subscriber:
+    def __init__(self, buffer_size: int) -> None:
+        self.queue: asyncio.Queue[tuple[int, str, Any]] = asyncio.Queue(maxsize=buffer_size)
+        self.dropped = 0
+
+
+class Broadcaster:
+    """Fans events out to SSE subscribers, each with a bounded buffer.
+
+    A subscriber whose buffer is full loses its pending events and gets a
+    ``resync`` event ahead of the newest one, telling the client to catch up
+    through the delta-sync endpoint. Publishers are never slowed down by slow consumers.
+    """
+
+    def __init__(self, buffer_size: int = 32) -> None:
+        self.buffer_size = max(buffer_size, 2)
+        self.last_event_id = 0
+        self._subscribers: set[Subscriber] = set()
+
+    def subscribe(self) -> Subscriber:
+        subscriber = Subscriber(self.buffer_size)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self._subscribers.discard(subscriber)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event: str, data: Any) -> int:
+        self.last_event_id += 1
+        for subscriber in self._subscribers:
+            try:
+                subscriber.queue.put_nowait((self.last_event_id, event, data))
+            except asyncio.QueueFull:
+                self._overflow(subscriber)
+                subscriber.queue.put_nowait((self.last_event_id, event, data))
+        return self.last_event_id
+
+    def send_resync(self, subscriber: Subscriber) -> None:
+        self._overflow(subscriber, dropped=False)
+
+    def _overflow(self, subscriber: Subscriber, dropped: bool = True) -> None:
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+            subscriber.dropped += 1
+        subscriber.queue.put_nowait((self.last_event_id, "resync", {"reason": "buffer_overflow" if dropped else "reconnect"}))
+
+
+def format_sse(event_id: int, event: str, data: Any) -> str:
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+async def sse_stream(
+    subscriber: Subscriber,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    heartbeat_seconds: float = 15.0,
+) -> AsyncIterator[str]:
+    yield "retry: 5000\n\n"
+    while not await is_disconnected():
+        try:
+            event_id, event, data = await asyncio.wait_for(subscriber.queue.get(), timeout=heartbeat_seconds)
+        except asyncio.TimeoutError:
+            yield ": keep-alive\n\n"
+            continue
+        yield format_sse(event_id, event, data)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+from typing import Any
+
+
+class _LazyModule(ModuleType):
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self._lazy_lock = threading.Lock()
+        self._lazy_module: ModuleType | None = None
+
+    def _load(self) -> ModuleType:
+        module = self._lazy_module
+        if module is None:
+            with self._lazy_lock:
+                if self._lazy_module is None:
+                    self._lazy_module = importlib.import_module(self.__name__)
+                module = self._lazy_module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        # Delegates on every access (no copying), so patches on the real module stay visible.
+        return getattr(self._load(), attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a stand-in for ``name`` that imports it on first attribute access.
+
+    The first load is serialised with a lock, so concurrent first use from many
+    threads is safe (importlib's ``LazyLoader`` is not on Python 3.11).
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return _LazyModule(name)
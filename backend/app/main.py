@@ -1,25 +1,75 @@
 from __future__ import annotations
 
+import base64
+import hmac
+import logging
 import re
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any
+from urllib.parse import urlencode
 from uuid import UUID
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-import requests
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 
+from app.cache import SingleFlightCache
 from app.config import settings
+from app.events import Broadcaster, sse_stream
+from app.lazy import lazy_import
+
+requests = lazy_import("requests")
+logger = logging.getLogger(__name__)
+
+
+WRITEUP_COLUMNS = "id,source,title,url,author,summary,published_at,created_at,is_favorite,is_read"
+_WRITEUP_FIELDS = frozenset(WRITEUP_COLUMNS.split(","))
+BULK_UPDATE_CHUNK_SIZE = 100
+# Rows this recent may belong to transactions that have not committed yet.
+CHANGES_SAFETY_MARGIN_SECONDS = 10
 
 
 def _sanitize_q(q: str) -> str:
     return re.sub(r'[*(,)]', '', q).strip()
 
 
+def _encode_change_token(updated_at: str, writeup_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{updated_at}|{writeup_id}".encode()).decode().rstrip("=")
+
+
+def _decode_change_token(token: str) -> tuple[str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        updated_at, writeup_id = raw.split("|", 1)
+        datetime.fromisoformat(updated_at)
+        UUID(writeup_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid since token") from exc
+    return updated_at, writeup_id
+
+
 class PatchFavoriteBody(BaseModel):
     is_favorite: bool
 
+
+class BulkUpdateBody(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=1000)
+    is_favorite: bool | None = None
+    is_read: bool | None = None
+
+
+class PublishWriteupsBody(BaseModel):
+    items: list[dict[str, Any]]
+
+
+_writeups_cache = SingleFlightCache(
+    ttl_seconds=settings.list_cache_ttl_seconds,
+    stale_seconds=settings.list_cache_stale_seconds,
+    max_entries=settings.list_cache_max_entries,
+)
+_broadcaster = Broadcaster(buffer_size=settings.events_buffer_size)
+
 app = FastAPI(title="Bug Bounty Writeups API", version="0.1.0")
 
 app.add_middleware(
@@ -48,7 +98,7 @@ def list_writeups(
     if not settings.supabase_url or not settings.supabase_service_key:
         raise HTTPException(status_code=500, detail="Missing SUPABASE_URL/SUPABASE_SERVICE_ROLE_KEY")
 
-    filters = ["select=id,source,title,url,author,summary,published_at,created_at,is_favorite"]
+    filters = [f"select={WRITEUP_COLUMNS}"]
     if source:
         filters.append(f"source=eq.{source}")
     if year:
@@ -75,12 +125,124 @@ def list_writeups(
         "apikey": settings.supabase_service_key,
         "Authorization": f"Bearer {settings.supabase_service_key}",
     }
+
+    def load() -> list[dict[str, Any]]:
+        try:
+            response = requests.get(endpoint, headers=headers, timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            raise HTTPException(status_code=502, detail=f"Supabase query failed: {exc}") from exc
+        return response.json()
+
+    return _writeups_cache.get(endpoint, load)
+
+
+@app.get("/api/writeups/changes")
+def list_writeup_changes(
+    since: str | None = Query(default=None),
+    limit: int = Query(default=500, ge=1, le=1000),
+) -> dict[str, Any]:
+    if not settings.supabase_url or not settings.supabase_service_key:
+        raise HTTPException(status_code=500, detail="Missing SUPABASE_URL/SUPABASE_SERVICE_ROLE_KEY")
+
+    params = {"select": f"{WRITEUP_COLUMNS},updated_at"}
+    if since:
+        # Keyset on (updated_at, id): rows written in one transaction share updated_at.
+        updated_at, writeup_id = _decode_change_token(since)
+        params["or"] = f'(updated_at.gt."{updated_at}",and(updated_at.eq."{updated_at}",id.gt.{writeup_id}))'
+    # Hold back the newest rows: one stamped earlier may still commit, and a token
+    # issued past it would skip it for good. They are returned on a later poll.
+    horizon = datetime.now(timezone.utc) - timedelta(seconds=CHANGES_SAFETY_MARGIN_SECONDS)
+    params["updated_at"] = f"lt.{horizon.isoformat()}"
+    params["order"] = "updated_at.asc,id.asc"
+    params["limit"] = str(limit)
+
+    endpoint = f"{settings.supabase_url}/rest/v1/writeups?{urlencode(params)}"
+    headers = {
+        "apikey": settings.supabase_service_key,
+        "Authorization": f"Bearer {settings.supabase_service_key}",
+    }
     try:
         response = requests.get(endpoint, headers=headers, timeout=30)
         response.raise_for_status()
     except requests.RequestException as exc:
         raise HTTPException(status_code=502, detail=f"Supabase query failed: {exc}") from exc
-    return response.json()
+
+    rows = response.json()
+    next_token = _encode_change_token(rows[-1]["updated_at"], rows[-1]["id"]) if rows else since
+    return {"changes": rows, "next": next_token, "has_more": len(rows) == limit}
+
+
+@app.get("/api/writeups/stream")
+async def stream_writeups(request: Request, last_event_id: str | None = Header(default=None)) -> StreamingResponse:
+    subscriber = _broadcaster.subscribe()
+    if last_event_id and last_event_id != str(_broadcaster.last_event_id):
+        # Events are not retained, so a reconnecting client that missed any must resync.
+        _broadcaster.send_resync(subscriber)
+
+    async def events():
+        try:
+            async for chunk in sse_stream(subscriber, request.is_disconnected, settings.events_heartbeat_seconds):
+                yield chunk
+        finally:
+            _broadcaster.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/writeups/events", status_code=202)
+async def publish_writeups(body: PublishWriteupsBody, authorization: str | None = Header(default=None)) -> dict[str, int]:
+    if not settings.events_publish_token:
+        raise HTTPException(status_code=503, detail="Missing EVENTS_PUBLISH_TOKEN")
+    # compare_digest rejects non-ASCII str, so compare the encoded bytes.
+    expected = f"Bearer {settings.events_publish_token}".encode()
+    if not hmac.compare_digest((authorization or "").encode(), expected):
+        raise HTTPException(status_code=401, detail="Invalid publish token")
+    _writeups_cache.invalidate()
+    # Events carry list-row fields only, so large enrichment text is never fanned out.
+    items = [{key: value for key, value in item.items() if key in _WRITEUP_FIELDS} for item in body.items]
+    event_id = _broadcaster.publish("writeups", items) if items else _broadcaster.last_event_id
+    return {"event_id": event_id, "subscribers": _broadcaster.subscriber_count}
+
+
+@app.patch("/api/writeups")
+def bulk_update_writeups(body: BulkUpdateBody) -> dict[str, list[dict[str, str]]]:
+    if not settings.supabase_url or not settings.supabase_service_key:
+        raise HTTPException(status_code=500, detail="Missing SUPABASE_URL/SUPABASE_SERVICE_ROLE_KEY")
+    changes = body.model_dump(include={"is_favorite", "is_read"}, exclude_none=True)
+    if not changes:
+        raise HTTPException(status_code=422, detail="Provide is_favorite and/or is_read")
+
+    headers = {
+        "apikey": settings.supabase_service_key,
+        "Authorization": f"Bearer {settings.supabase_service_key}",
+        "Content-Type": "application/json",
+        "Prefer": "return=representation",
+    }
+    ids = [str(writeup_id) for writeup_id in dict.fromkeys(body.ids)]
+    statuses: dict[str, str] = {}
+    for i in range(0, len(ids), BULK_UPDATE_CHUNK_SIZE):
+        chunk = ids[i : i + BULK_UPDATE_CHUNK_SIZE]
+        endpoint = f"{settings.supabase_url}/rest/v1/writeups?select=id&id=in.({','.join(chunk)})"
+        try:
+            response = requests.patch(endpoint, headers=headers, json=changes, timeout=30)
+            response.raise_for_status()
+            updated = {row["id"] for row in response.json()}
+        except (requests.RequestException, ValueError) as exc:
+            logger.warning("bulk update chunk failed: %s", exc)
+            statuses.update((writeup_id, "error") for writeup_id in chunk)
+            continue
+        statuses.update((writeup_id, "updated" if writeup_id in updated else "not_found") for writeup_id in chunk)
+
+    if all(status == "error" for status in statuses.values()):
+        raise HTTPException(status_code=502, detail="Supabase update failed")
+    if "updated" in statuses.values():
+        _writeups_cache.invalidate()
+    return {"results": [{"id": writeup_id, "status": status} for writeup_id, status in statuses.items()]}
 
 
 @app.patch("/api/writeups/{writeup_id}", status_code=204, response_model=None)
@@ -99,3 +261,4 @@ def patch_favorite(writeup_id: UUID, body: PatchFavoriteBody) -> None:
         response.raise_for_status()
     except requests.RequestException as exc:
         raise HTTPException(status_code=502, detail=f"Supabase update failed: {exc}") from exc
+    _writeups_cache.invalidate()
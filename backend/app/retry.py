@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import random
+import threading
+import time
+from typing import Callable
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class FetchPolicy:
+    """Per-host circuit breakers, jittered backoff and a retry budget shared by one run.
+
+    A host's breaker opens after ``failure_threshold`` consecutive fetches that failed
+    even after retries, and rejects requests until its cooldown ends; the next fetch is a single-attempt
+    trial that either closes it or reopens it with a doubled cooldown. Breaker state
+    is written to ``state_path`` on every change so it carries over between runs.
+
+    The default cooldowns (20 h doubling to 160 h) outlast the daily job's interval
+    and are not whole days, so each scheduled run lands clearly inside or after one.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay_seconds: float = 2.0,
+        max_delay_seconds: float = 30.0,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 20 * 3600.0,
+        max_cooldown_seconds: float = 160 * 3600.0,
+        retry_budget: int = 20,
+        state_path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self.retries_left = retry_budget
+        self.state_path = state_path
+        self._clock = clock
+        self._rng = rng
+        self._lock = threading.Lock()
+        self._hosts: dict[str, dict] = {}
+        if state_path is not None and state_path.exists():
+            try:
+                self._hosts = json.loads(state_path.read_text(encoding="utf-8")).get("hosts") or {}
+            except (OSError, ValueError) as exc:
+                print(f"[warn] ignoring unreadable breaker state {state_path}: {exc}")
+
+    def check(self, host: str) -> bool:
+        """Raise if ``host``'s breaker is open; return True if this fetch is its half-open trial."""
+        with self._lock:
+            state = self._hosts.get(host)
+            if not state or not state.get("open_until"):
+                return False
+            now = self._clock()
+            if state["open_until"] > now:
+                raise CircuitOpenError(
+                    f"circuit open for host={host} after {state['failures']} consecutive failures; "
+                    f"retrying in {int(state['open_until'] - now)}s"
+                )
+            # Keep the breaker open for everyone else while this caller makes the trial.
+            state["open_until"] = now + state["cooldown"]
+            return True
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            if self._hosts.pop(host, None) is not None:
+                self._save()
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            state = self._hosts.setdefault(host, {"failures": 0, "open_until": 0, "cooldown": 0})
+            state["failures"] += 1
+            if state["failures"] >= self.failure_threshold:
+                cooldown = min(state["cooldown"] * 2, self.max_cooldown_seconds) if state["cooldown"] else self.cooldown_seconds
+                state["cooldown"] = cooldown
+                state["open_until"] = self._clock() + cooldown
+            self._save()
+
+    def take_retry(self) -> bool:
+        with self._lock:
+            if self.retries_left <= 0:
+                return False
+            self.retries_left -= 1
+            return True
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.max_delay_seconds)
+        # Equal jitter: at least half the exponential delay, so a short outage is waited
+        # out, plus a random half that keeps parallel fetchers from retrying in lockstep.
+        half = min(self.base_delay_seconds * (2**attempt), self.max_delay_seconds) / 2
+        return half + self._rng() * half
+
+    def _save(self) -> None:
+        if self.state_path is None:
+            return
+        tmp_path = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps({"hosts": self._hosts}, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.state_path)
@@ -1,16 +1,42 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
+from html.parser import HTMLParser
 import json
 import os
-from typing import Iterable
-from urllib.parse import quote
+import re
+import time
+from typing import TYPE_CHECKING, Iterable, Iterator
+from urllib.parse import quote, urljoin, urlsplit
 import xml.etree.ElementTree as ET
 
+from app.lazy import lazy_import
+from app.retry import FetchPolicy
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+requests = lazy_import("requests")
+
 MIN_DATE = datetime(2025, 1, 1, tzinfo=timezone.utc)
 USER_AGENT = "site-scrapper/1.0 (+https://github.com/)"
+PORTSWIGGER_RSS_URL = "https://portswigger.net/research/rss"
+MEDIUM_RSS_URL = "https://medium.com/feed/tag/bug-bounty"
+HACKERONE_HACKTIVITY_URL = "https://api.hackerone.com/v1/hackers/hacktivity?page[size]=100&queryString=disclosed:true"
+TELEGRAM_API_URL = "https://api.telegram.org"
+# Field order of the compact tuples parse workers send back to the parent process.
+RECORD_FIELDS = ("source", "title", "url", "published_at", "author", "summary")
+# List-row fields a scraped item already has; stream clients match events on url and
+# fetch full rows (id, flags, enrichment) through /api/writeups/changes.
+EVENT_FIELDS = ("source", "title", "url", "author", "summary", "published_at")
+# Base URL and article-link pattern for HTML listing pages (archives and indexes).
+HTML_LISTINGS: dict[str, tuple[str, re.Pattern]] = {
+    "medium": ("https://medium.com", re.compile(r"^(?:https://(?:[\w-]+\.)?medium\.com)?/[^?#]*-[0-9a-f]{8,12}(?:[?#].*)?$")),
+    "portswigger": ("https://portswigger.net", re.compile(r"^(?:https://portswigger\.net)?/research/(?!articles$|rss$)[a-z0-9-]+$")),
+}
 
 
 @dataclass
@@ -146,20 +172,148 @@ def parse_hackerone_hacktivity_api(payload: dict) -> list[dict]:
     return items
 
 
-def fetch_hackerone_hacktivity_api(username: str, api_token: str) -> list[dict]:
-    import requests
+class _ListingParser(HTMLParser):
+    def __init__(self, base_url: str, link_pattern: re.Pattern) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.link_pattern = link_pattern
+        self.entries: list[dict] = []
+        self._href: str | None = None
+        self._text: list[str] = []
+        self._pending_date: str | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        values = dict(attrs)
+        if tag == "a":
+            href = (values.get("href") or "").strip()
+            self._href = href if self.link_pattern.match(href) else None
+            self._text = []
+        elif tag == "time" and values.get("datetime"):
+            # A card's <time> may come before or after its link: date the links seen
+            # since the previous <time>, or hold the date for the next link.
+            undated = [entry for entry in self.entries if entry["date"] is None]
+            for entry in undated:
+                entry["date"] = values["datetime"]
+            if not undated:
+                self._pending_date = values["datetime"]
+
+    def handle_data(self, data: str) -> None:
+        if self._href is not None:
+            self._text.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag != "a" or self._href is None:
+            return
+        url = urljoin(self.base_url, self._href.split("?", 1)[0].split("#", 1)[0])
+        title = " ".join("".join(self._text).split())
+        self.entries.append({"url": url, "title": title, "date": self._pending_date})
+        self._pending_date = None
+        self._href = None
+
+
+def parse_html_listing(html: str, source: str, fallback_date: str | None = None) -> list[dict]:
+    base_url, link_pattern = HTML_LISTINGS[source]
+    parser = _ListingParser(base_url, link_pattern)
+    parser.feed(html)
+    parser.close()
+
+    merged: dict[str, dict] = {}
+    for entry in parser.entries:
+        current = merged.setdefault(entry["url"], {"title": "", "date": None})
+        if len(entry["title"]) > len(current["title"]):
+            current["title"] = entry["title"]
+        current["date"] = current["date"] or entry["date"]
+
+    items: list[dict] = []
+    for url, entry in merged.items():
+        published_raw = entry["date"] or fallback_date
+        if not entry["title"] or not published_raw:
+            continue
+        items.append(
+            WriteupItem(
+                source=source,
+                title=entry["title"],
+                url=url,
+                published_at=_parse_date(published_raw),
+            ).to_record()
+        )
+    return items
+
+
+def _parse_job(job: tuple) -> list[tuple]:
+    kind, source, body, *extra = job
+    if kind == "hackerone":
+        try:
+            records = parse_hackerone_hacktivity_api(json.loads(body))
+        except ValueError:
+            records = []
+    elif kind == "html":
+        records = parse_html_listing(body, source, fallback_date=extra[0] if extra else None)
+    else:
+        records = parse_rss_items(body, source=source)
+    return [tuple(record[field] for field in RECORD_FIELDS) for record in records]
+
+
+def _expand_records(records: list[tuple]) -> Iterator[dict]:
+    for record in records:
+        yield dict(zip(RECORD_FIELDS, record))
+
+
+def parse_bodies(jobs: Iterable[tuple], workers: int = 1, pool: Executor | None = None) -> Iterator[dict]:
+    """Parse fetched ``(kind, source, body)`` jobs, where kind is ``rss``, ``hackerone`` or ``html``.
+
+    ``html`` jobs may carry a fourth element: the date to use for links without a ``<time>``.
+
+    With ``workers > 1`` bodies are parsed in a process pool (``pool`` if given, so callers
+    parsing many batches can reuse one); at most ``2 * workers`` jobs are in flight and
+    records are yielded in job order as they complete.
+    """
+    if pool is not None:
+        yield from _parse_in_pool(pool, jobs, workers)
+        return
+    if workers <= 1:
+        for job in jobs:
+            yield from _expand_records(_parse_job(job))
+        return
+
+    # Imported here: it pulls in multiprocessing, which the default single-worker run never needs.
+    from concurrent.futures import ProcessPoolExecutor
 
-    endpoint = "https://api.hackerone.com/v1/hackers/hacktivity?page[size]=100&queryString=disclosed:true"
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from _parse_in_pool(pool, jobs, workers)
+
+
+def _parse_in_pool(pool: Executor, jobs: Iterable[tuple], workers: int) -> Iterator[dict]:
+    pending = deque()
+    for job in jobs:
+        pending.append(pool.submit(_parse_job, job))
+        if len(pending) >= max(workers, 1) * 2:
+            yield from _expand_records(pending.popleft().result())
+    while pending:
+        yield from _expand_records(pending.popleft().result())
+
+
+def fetch_hackerone_hacktivity_api(username: str, api_token: str) -> list[dict]:
+    endpoint = HACKERONE_HACKTIVITY_URL
     collected: list[dict] = []
+    host = _host(endpoint)
+    fetch_policy.check(host)
 
     for _ in range(3):
-        resp = requests.get(
-            endpoint,
-            headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
-            auth=(username, api_token),
-            timeout=30,
-        )
-        resp.raise_for_status()
+        try:
+            resp = requests.get(
+                endpoint,
+                headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
+                auth=(username, api_token),
+                timeout=30,
+            )
+            resp.raise_for_status()
+        except requests.RequestException as exc:
+            status = getattr(getattr(exc, "response", None), "status_code", None)
+            if status in {429, 500, 502, 503, 504} or status is None:
+                fetch_policy.record_failure(host)
+            raise
+        fetch_policy.record_success(host)
         payload = resp.json()
         collected.extend(parse_hackerone_hacktivity_api(payload))
         next_url = (payload.get("links") or {}).get("next")
@@ -170,7 +324,7 @@ def fetch_hackerone_hacktivity_api(username: str, api_token: str) -> list[dict]:
     return dedupe_items(collected)
 
 
-def filter_recent_items(items: Iterable[dict]) -> list[dict]:
+def filter_recent_items(items: Iterable[dict], min_date: datetime = MIN_DATE) -> list[dict]:
     out: list[dict] = []
     for item in items:
         value = item.get("published_at")
@@ -180,7 +334,7 @@ def filter_recent_items(items: Iterable[dict]) -> list[dict]:
             date_value = _force_utc(value)
         else:
             date_value = datetime.now(timezone.utc)
-        if date_value >= MIN_DATE:
+        if date_value >= min_date:
             new_item = dict(item)
             new_item["published_at"] = date_value
             out.append(new_item)
@@ -199,29 +353,48 @@ def dedupe_items(items: Iterable[dict]) -> list[dict]:
     return deduped
 
 
-def _get(url: str) -> str:
-    import requests
-    import time
+fetch_policy = FetchPolicy()
+
+
+def configure_fetch_policy(**options) -> FetchPolicy:
+    """Replace the module's fetch policy, e.g. to load persisted breaker state at the start of a run."""
+    global fetch_policy
+    fetch_policy = FetchPolicy(**options)
+    return fetch_policy
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).netloc or url
+
 
-    max_attempts = 4
-    backoff_seconds = 2.0
-    for attempt in range(max_attempts):
+def _get(url: str, auth: tuple[str, str] | None = None, policy: FetchPolicy | None = None) -> str:
+    policy = policy or fetch_policy
+    host = _host(url)
+    # A half-open trial gets one attempt, so a host that is still down costs a single request.
+    attempts = 1 if policy.check(host) else policy.max_attempts
+    for attempt in range(attempts):
+        last_attempt = attempt >= attempts - 1
         try:
-            res = requests.get(url, timeout=30, headers={"User-Agent": USER_AGENT})
-            if res.status_code == 429 and attempt < max_attempts - 1:
+            res = requests.get(url, timeout=30, headers={"User-Agent": USER_AGENT}, auth=auth)
+            if res.status_code == 429 and not last_attempt and policy.take_retry():
                 retry_after = res.headers.get("Retry-After")
-                wait_seconds = float(retry_after) if retry_after and retry_after.isdigit() else backoff_seconds * (2**attempt)
-                time.sleep(min(wait_seconds, 30.0))
+                time.sleep(policy.backoff(attempt, float(retry_after) if retry_after and retry_after.isdigit() else None))
                 continue
             res.raise_for_status()
+            policy.record_success(host)
             return res.text
         except requests.RequestException as exc:
             response = getattr(exc, "response", None)
             status = getattr(response, "status_code", None)
             retriable = status in {429, 500, 502, 503, 504} or status is None
-            if not retriable or attempt >= max_attempts - 1:
+            if not retriable:
+                # The host answered; only outages and throttling count against its breaker.
+                policy.record_success(host)
                 raise
-            time.sleep(min(backoff_seconds * (2**attempt), 30.0))
+            if last_attempt or not policy.take_retry():
+                policy.record_failure(host)
+                raise
+            time.sleep(policy.backoff(attempt))
 
     raise RuntimeError(f"failed to fetch {url}")
 
@@ -229,19 +402,22 @@ def _get(url: str) -> str:
 def collect_all_sources(
     hackerone_username: str | None = None,
     hackerone_api_token: str | None = None,
+    workers: int = 1,
+    min_date: datetime | str | None = None,
 ) -> list[dict]:
     all_items: list[dict] = []
-    sources: list[tuple[str, str, callable]] = [
-        ("portswigger", "https://portswigger.net/research/rss", lambda body: parse_rss_items(body, source="portswigger")),
-        ("medium", "https://medium.com/feed/tag/bug-bounty", lambda body: parse_rss_items(body, source="medium")),
+    sources: list[tuple[str, str]] = [
+        ("portswigger", PORTSWIGGER_RSS_URL),
+        ("medium", MEDIUM_RSS_URL),
     ]
 
-    for source_name, source_url, parser in sources:
+    jobs: list[tuple[str, str, str]] = []
+    for source_name, source_url in sources:
         try:
-            source_body = _get(source_url)
-            all_items.extend(parser(source_body))
+            jobs.append(("rss", source_name, _get(source_url)))
         except Exception as exc:
             print(f"[warn] failed collecting source={source_name} url={source_url}: {exc}")
+    all_items.extend(parse_bodies(jobs, workers=workers))
 
     h1_user = (hackerone_username or os.getenv("HACKERONE_USERNAME") or "").strip()
     h1_token = (hackerone_api_token or os.getenv("HACKERONE_API_TOKEN") or "").strip()
@@ -254,7 +430,9 @@ def collect_all_sources(
     else:
         print("[warn] skipping hackerone api: HACKERONE_USERNAME/HACKERONE_API_TOKEN not configured")
 
-    return dedupe_items(filter_recent_items(all_items))
+    if isinstance(min_date, str):
+        min_date = _parse_date(min_date)
+    return dedupe_items(filter_recent_items(all_items, min_date=min_date or MIN_DATE))
 
 
 def _supabase_headers(service_role_key: str) -> dict:
@@ -266,8 +444,6 @@ def _supabase_headers(service_role_key: str) -> dict:
 
 
 def fetch_existing_urls(supabase_url: str, service_role_key: str, urls: list[str]) -> set[str]:
-    import requests
-
     if not urls:
         return set()
     existing: set[str] = set()
@@ -284,14 +460,18 @@ def fetch_existing_urls(supabase_url: str, service_role_key: str, urls: list[str
     return existing
 
 
-def upsert_items_to_supabase(supabase_url: str, service_role_key: str, items: list[dict]) -> int:
-    import requests
-
+def upsert_items_to_supabase(
+    supabase_url: str,
+    service_role_key: str,
+    items: list[dict],
+    ignore_duplicates: bool = False,
+) -> int:
     if not items:
         return 0
     endpoint = f"{supabase_url}/rest/v1/writeups?on_conflict=url"
     headers = _supabase_headers(service_role_key)
-    headers["Prefer"] = "resolution=merge-duplicates,return=minimal"
+    resolution = "ignore-duplicates" if ignore_duplicates else "merge-duplicates"
+    headers["Prefer"] = f"resolution={resolution},return=minimal"
     payload = []
     for item in items:
         row = dict(item)
@@ -304,22 +484,35 @@ def upsert_items_to_supabase(supabase_url: str, service_role_key: str, items: li
 
 
 def send_telegram_message(bot_token: str, chat_id: str, message: str) -> None:
-    import requests
-
     if not bot_token or not chat_id:
         return
-    endpoint = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+    endpoint = f"{TELEGRAM_API_URL}/bot{bot_token}/sendMessage"
     requests.post(endpoint, json={"chat_id": chat_id, "text": message, "disable_web_page_preview": True}, timeout=30).raise_for_status()
 
 
 def send_discord_message(webhook_url: str, message: str) -> None:
-    import requests
-
     if not webhook_url:
         return
     requests.post(webhook_url, json={"content": message}, timeout=30).raise_for_status()
 
 
+def publish_new_writeups(endpoint: str, token: str, items: list[dict]) -> None:
+    if not endpoint or not token or not items:
+        return
+    payload = []
+    for item in items:
+        row = {field: item.get(field) for field in EVENT_FIELDS}
+        if isinstance(row.get("published_at"), datetime):
+            row["published_at"] = row["published_at"].isoformat()
+        payload.append(row)
+    requests.post(
+        endpoint,
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+        data=json.dumps({"items": payload}),
+        timeout=30,
+    ).raise_for_status()
+
+
 def format_daily_digest(items: list[dict]) -> str:
     if not items:
         return "Nenhum novo write-up hoje."
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.backfill import BACKFILL_SOURCES, CheckpointStore, parse_backfill_date, run_backfill
+from app.config import settings
+from app.retry import FetchPolicy
+from app.scraper import _get, upsert_items_to_supabase
+
+DEFAULT_CHECKPOINT = Path(__file__).resolve().parents[1] / ".backfill-checkpoint.json"
+DEFAULT_BREAKER_STATE = Path(__file__).resolve().parents[1] / ".backfill-breakers.json"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load writeup history for a date range, resumably.")
+    parser.add_argument("--since", required=True, help="ISO date/datetime, inclusive (e.g. 2022-01-01)")
+    parser.add_argument(
+        "--until",
+        default=None,
+        help="ISO date/datetime, inclusive (default: just before MIN_PUBLISHED_DATE, where the daily scrape starts)",
+    )
+    parser.add_argument("--sources", default=",".join(BACKFILL_SOURCES), help="comma-separated subset of sources")
+    parser.add_argument("--checkpoint", type=Path, default=DEFAULT_CHECKPOINT)
+    parser.add_argument("--breaker-state", type=Path, default=DEFAULT_BREAKER_STATE)
+    parser.add_argument("--delay", type=float, default=2.0, help="seconds between page fetches")
+    parser.add_argument("--workers", type=int, default=settings.parse_workers)
+    parser.add_argument("--max-pages", type=int, default=None, help="stop each source after this many pages")
+    args = parser.parse_args(argv)
+
+    if not settings.supabase_url or not settings.supabase_service_key:
+        raise SystemExit("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY are required")
+
+    since = parse_backfill_date(args.since)
+    if args.until is not None:
+        until = parse_backfill_date(args.until)
+    else:
+        until = parse_backfill_date(settings.min_date) - timedelta(microseconds=1)
+    if since > until:
+        raise SystemExit("--since must not be after --until")
+
+    # A separate policy and state file: throttling while walking thousands of archive
+    # pages must not open the medium.com breaker the daily feed fetch relies on.
+    policy = FetchPolicy(
+        retry_budget=settings.fetch_retry_budget,
+        failure_threshold=settings.fetch_breaker_threshold,
+        cooldown_seconds=settings.fetch_breaker_cooldown_seconds,
+        state_path=args.breaker_state,
+    )
+    fetchers = {}
+    for source in [name.strip() for name in args.sources.split(",") if name.strip()]:
+        if source not in BACKFILL_SOURCES:
+            raise SystemExit(f"unknown source {source!r}; choose from {', '.join(BACKFILL_SOURCES)}")
+        if source == "hackerone":
+            if not settings.hackerone_username or not settings.hackerone_api_token:
+                print("[warn] skipping hackerone backfill: HACKERONE_USERNAME/HACKERONE_API_TOKEN not configured")
+                continue
+            fetchers[source] = partial(
+                _get, auth=(settings.hackerone_username, settings.hackerone_api_token), policy=policy
+            )
+        else:
+            fetchers[source] = partial(_get, policy=policy)
+
+    store = CheckpointStore(args.checkpoint, since, until)
+    totals = run_backfill(
+        store,
+        since,
+        until,
+        fetchers,
+        # Listing pages lack summaries/authors and may only know the archive day,
+        # so rows already stored (e.g. from RSS) must never be overwritten.
+        upsert=partial(
+            upsert_items_to_supabase,
+            settings.supabase_url,
+            settings.supabase_service_key,
+            ignore_duplicates=True,
+        ),
+        delay_seconds=args.delay,
+        workers=args.workers,
+        max_pages=args.max_pages,
+    )
+
+    print(" | ".join(f"{source}: {count}" for source, count in totals.items()) or "Nothing to backfill")
+    incomplete = [source for source in fetchers if not store.state(source)["done"]]
+    if incomplete:
+        print(f"Incomplete: {', '.join(incomplete)} (re-run the same command to resume)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+import sys
+import time
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.scraper import dedupe_items, filter_recent_items, parse_bodies
+
+
+def _synthetic_feed(page: int, items_per_page: int) -> str:
+    entries = []
+    for i in range(items_per_page):
+        entries.append(
+            "<item>"
+            f"<title>Writeup {page}-{i}</title>"
+            f"<link>https://example.com/{page}/{i}</link>"
+            "<pubDate>Mon, 15 Jan 2026 10:00:00 GMT</pubDate>"
+            f"<description>{'lorem ipsum ' * 40}</description>"
+            "</item>"
+        )
+    return f"<rss><channel>{''.join(entries)}</channel></rss>"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark parse_bodies throughput per worker count.")
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--items-per-page", type=int, default=50)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    jobs = [("rss", "medium", _synthetic_feed(page, args.items_per_page)) for page in range(args.pages)]
+    worker_counts = sorted({1, *(2**i for i in range(1, args.max_workers.bit_length())), args.max_workers})
+
+    baseline = None
+    for workers in worker_counts:
+        started = time.perf_counter()
+        items = dedupe_items(filter_recent_items(parse_bodies(jobs, workers=workers)))
+        elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(
+            f"workers={workers:<3} pages/s={args.pages / elapsed:8.1f} "
+            f"items={len(items)} speedup={baseline / elapsed:.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import argparse
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import importlib.util
+import io
+import json
+from pathlib import Path
+import random
+import sys
+import threading
+import time
+import types
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+import uuid
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app import scraper
+from app.config import Settings
+
+UPSTREAMS = ("rss", "hackerone", "supabase", "telegram", "discord")
+API_QUERIES = ["", "?source=medium", "?source=portswigger", "?source=hackerone", "?q=ssrf", "?year=2026"]
+
+
+@dataclass
+class Faults:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+
+
+@dataclass
+class UpstreamStats:
+    requests: int = 0
+    injected_errors: int = 0
+    injected_429s: int = 0
+
+
+class FakeUpstreams:
+    """Local stand-ins for the RSS feeds, HackerOne, Supabase PostgREST, Telegram and Discord.
+
+    Every upstream is served by one threaded HTTP server under its own path prefix,
+    with per-upstream latency, 5xx and 429 injection. The Supabase stand-in keeps
+    upserted rows in memory so repeated scrape runs see their earlier writes.
+    """
+
+    def __init__(self, faults: dict[str, Faults], feed_items: int = 50, h1_pages: int = 2, seed: int = 0) -> None:
+        self.faults = faults
+        self.h1_pages = h1_pages
+        self.stats: dict[str, UpstreamStats] = defaultdict(UpstreamStats)
+        self.rows: dict[str, dict] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._feeds = {source: self._feed(source, feed_items) for source in ("portswigger", "medium")}
+        self._h1_items_per_page = feed_items
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self) -> FakeUpstreams:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    @staticmethod
+    def _feed(source: str, count: int) -> str:
+        now = datetime.now(timezone.utc)
+        entries = "".join(
+            "<item>"
+            f"<title>{source} writeup {i}</title>"
+            f"<link>https://{source}.example/writeups/{i}</link>"
+            f"<pubDate>{format_datetime(now - timedelta(hours=i))}</pubDate>"
+            f"<description>SSRF and IDOR notes {i}</description>"
+            "</item>"
+            for i in range(count)
+        )
+        return f"<rss><channel>{entries}</channel></rss>"
+
+    def _hacktivity_page(self, page: int) -> dict:
+        now = datetime.now(timezone.utc)
+        data = [
+            {
+                "attributes": {
+                    "title": f"HackerOne report {page}-{i}",
+                    "url": f"https://hackerone.com/reports/{page * 10_000 + i}",
+                    "disclosed_at": (now - timedelta(days=page, minutes=i)).isoformat(),
+                }
+            }
+            for i in range(self._h1_items_per_page)
+        ]
+        links = {}
+        if page < self.h1_pages:
+            links["next"] = f"{self.base_url}/hackerone/v1/hackers/hacktivity?page[size]=100&page[number]={page + 1}"
+        return {"data": data, "links": links}
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        fakes = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                fakes._handle(self, "GET")
+
+            def do_POST(self) -> None:
+                fakes._handle(self, "POST")
+
+            def do_PATCH(self) -> None:
+                fakes._handle(self, "PATCH")
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
+
+    def _handle(self, handler: BaseHTTPRequestHandler, method: str) -> None:
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length) if length else b""
+        parts = urlsplit(handler.path)
+        upstream = parts.path.strip("/").split("/", 1)[0]
+        faults = self.faults.get(upstream, Faults())
+
+        with self._lock:
+            self.stats[upstream].requests += 1
+            roll = self._random.random()
+            jitter = self._random.uniform(0, faults.jitter_ms)
+        time.sleep((faults.latency_ms + jitter) / 1000)
+
+        if roll < faults.rate_limit_rate:
+            with self._lock:
+                self.stats[upstream].injected_429s += 1
+            return self._send(handler, 429, {"message": "rate limited"}, {"Retry-After": "0"})
+        if roll < faults.rate_limit_rate + faults.error_rate:
+            with self._lock:
+                self.stats[upstream].injected_errors += 1
+            return self._send(handler, 500, {"message": "injected failure"})
+
+        if upstream == "rss":
+            feed = self._feeds.get(parts.path.rsplit("/", 1)[-1])
+            return self._send(handler, 200 if feed else 404, feed or "")
+        if upstream == "hackerone":
+            page = int((parse_qs(parts.query).get("page[number]") or ["1"])[0])
+            return self._send(handler, 200, self._hacktivity_page(page))
+        if upstream == "supabase":
+            return self._handle_supabase(handler, method, parse_qs(parts.query), body)
+        if upstream == "telegram":
+            return self._send(handler, 200, {"ok": True})
+        if upstream == "discord":
+            return self._send(handler, 204, "")
+        return self._send(handler, 404, "")
+
+    def _handle_supabase(self, handler: BaseHTTPRequestHandler, method: str, query: dict, body: bytes) -> None:
+        if method == "POST":
+            now = datetime.now(timezone.utc).isoformat()
+            with self._lock:
+                for row in json.loads(body or b"[]"):
+                    stored = self.rows.setdefault(row["url"], {"id": str(uuid.uuid4()), "created_at": now, "is_favorite": False, "is_read": False})
+                    stored.update(row, updated_at=now)
+            return self._send(handler, 201, "")
+        if method == "PATCH":
+            return self._send(handler, 200, [])
+
+        url_filter = (query.get("url") or [""])[0]
+        with self._lock:
+            if url_filter.startswith("in.("):
+                wanted = url_filter[len("in.(") : -1].split(",")
+                return self._send(handler, 200, [{"url": url} for url in wanted if url in self.rows])
+            rows = sorted(self.rows.values(), key=lambda row: row.get("published_at", ""), reverse=True)
+        limit = int((query.get("limit") or ["100"])[0])
+        return self._send(handler, 200, rows[:limit])
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, payload, headers: dict | None = None) -> None:
+        data = payload.encode() if isinstance(payload, str) else json.dumps(payload).encode()
+        handler.send_response(status)
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.send_header("Content-Type", "text/plain" if isinstance(payload, str) else "application/json")
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        if status != 204:
+            handler.wfile.write(data)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _latency_summary(latencies_ms: list[float], elapsed_s: float) -> dict:
+    return {
+        "count": len(latencies_ms),
+        "throughput_per_s": round(len(latencies_ms) / elapsed_s, 2) if elapsed_s else 0.0,
+        "p50_ms": round(_percentile(latencies_ms, 50), 2),
+        "p95_ms": round(_percentile(latencies_ms, 95), 2),
+        "p99_ms": round(_percentile(latencies_ms, 99), 2),
+        "max_ms": round(max(latencies_ms, default=0.0), 2),
+    }
+
+
+def _load_scrape_module() -> types.ModuleType:
+    module_path = Path(__file__).resolve().parent / "scrape_and_notify.py"
+    spec = importlib.util.spec_from_file_location("scrape_and_notify", module_path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_scrape(fakes: FakeUpstreams, runs: int, workers: int = 1) -> dict:
+    """Run ``scrape_and_notify.main`` ``runs`` times against the stand-ins.
+
+    Retry sleeps are recorded instead of slept, so backoff shows up as a number
+    rather than as wall-clock time.
+    """
+    module = _load_scrape_module()
+    module.settings = replace(
+        Settings(),
+        supabase_url=f"{fakes.base_url}/supabase",
+        supabase_service_key="loadtest",
+        telegram_bot_token="loadtest",
+        telegram_chat_id="loadtest",
+        discord_webhook_url=f"{fakes.base_url}/discord/webhook",
+        hackerone_username="loadtest",
+        hackerone_api_token="loadtest",
+        parse_workers=workers,
+        min_date="2025-01-01T00:00:00+00:00",
+        enrich_articles=False,
+        events_publish_url="",
+        # Each run starts with closed breakers, as a fresh checkout would.
+        fetch_state_path="",
+    )
+    backoff_sleeps: list[float] = []
+    durations_ms: list[float] = []
+    failures: Counter[str] = Counter()
+    started = time.perf_counter()
+    with (
+        patch.multiple(
+            scraper,
+            PORTSWIGGER_RSS_URL=f"{fakes.base_url}/rss/portswigger",
+            MEDIUM_RSS_URL=f"{fakes.base_url}/rss/medium",
+            HACKERONE_HACKTIVITY_URL=f"{fakes.base_url}/hackerone/v1/hackers/hacktivity?page[size]=100",
+            TELEGRAM_API_URL=f"{fakes.base_url}/telegram",
+        ),
+        patch.object(scraper, "time", types.SimpleNamespace(sleep=backoff_sleeps.append)),
+    ):
+        for _ in range(runs):
+            run_started = time.perf_counter()
+            try:
+                with redirect_stdout(io.StringIO()):
+                    module.main()
+            except Exception as exc:
+                failures[type(exc).__name__] += 1
+            durations_ms.append((time.perf_counter() - run_started) * 1000)
+
+    report = _latency_summary(durations_ms, time.perf_counter() - started)
+    report.update(
+        failed_runs=sum(failures.values()),
+        failures=dict(failures),
+        retry_sleeps=len(backoff_sleeps),
+        backoff_seconds_requested=round(sum(backoff_sleeps), 2),
+        rows_stored=len(fakes.rows),
+    )
+    return report
+
+
+def run_api(fakes: FakeUpstreams, requests_total: int, concurrency: int, use_cache: bool = True) -> dict:
+    """Serve the API with uvicorn and hit ``GET /api/writeups`` from ``concurrency`` clients."""
+    import requests
+    import uvicorn
+
+    from app import main as api
+
+    api_settings = replace(
+        api.settings,
+        supabase_url=f"{fakes.base_url}/supabase",
+        supabase_service_key="loadtest",
+    )
+    server = uvicorn.Server(uvicorn.Config(api.app, host="127.0.0.1", port=0, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+
+    with (
+        patch.object(api, "settings", api_settings),
+        patch.object(api._writeups_cache, "ttl_seconds", api._writeups_cache.ttl_seconds if use_cache else 0),
+        patch.object(api._writeups_cache, "stale_seconds", api._writeups_cache.stale_seconds if use_cache else 0),
+    ):
+        api._writeups_cache.invalidate()
+        thread.start()
+        while not server.started:
+            time.sleep(0.01)
+        port = server.servers[0].sockets[0].getsockname()[1]
+        local = threading.local()
+        statuses: Counter[int] = Counter()
+        latencies_ms: list[float] = []
+        lock = threading.Lock()
+
+        def hit(i: int) -> None:
+            session = getattr(local, "session", None) or requests.Session()
+            local.session = session
+            request_started = time.perf_counter()
+            try:
+                status = session.get(f"http://127.0.0.1:{port}/api/writeups{API_QUERIES[i % len(API_QUERIES)]}", timeout=60).status_code
+            except requests.RequestException:
+                status = 0
+            elapsed_ms = (time.perf_counter() - request_started) * 1000
+            with lock:
+                statuses[status] += 1
+                latencies_ms.append(elapsed_ms)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(hit, range(requests_total)))
+        elapsed = time.perf_counter() - started
+        server.should_exit = True
+        thread.join(timeout=10)
+
+    report = _latency_summary(latencies_ms, elapsed)
+    report["statuses"] = {str(status): count for status, count in sorted(statuses.items())}
+    return report
+
+
+def format_report(report: dict) -> str:
+    lines = []
+    for section in ("scrape", "api"):
+        if section in report:
+            values = " ".join(f"{key}={value}" for key, value in report[section].items())
+            lines.append(f"[{section}] {values}")
+    for upstream, stats in report["upstreams"].items():
+        lines.append(f"[upstream:{upstream}] " + " ".join(f"{key}={value}" for key, value in stats.items()))
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay fixtures against local upstream stand-ins and report throughput/latency.")
+    parser.add_argument("--scrape-runs", type=int, default=3)
+    parser.add_argument("--parse-workers", type=int, default=1)
+    parser.add_argument("--api-requests", type=int, default=500, help="0 skips the API load phase")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--no-cache", action="store_true", help="disable the API list cache during the API phase")
+    parser.add_argument("--feed-items", type=int, default=50)
+    parser.add_argument("--h1-pages", type=int, default=2)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--fault-upstreams", default=",".join(UPSTREAMS), help="upstreams that get the latency/error settings")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, default=None, help="also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    fault = Faults(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit_rate)
+    faults = {name.strip(): fault for name in args.fault_upstreams.split(",") if name.strip()}
+
+    report: dict = {}
+    with FakeUpstreams(faults, feed_items=args.feed_items, h1_pages=args.h1_pages, seed=args.seed) as fakes:
+        if args.scrape_runs:
+            report["scrape"] = run_scrape(fakes, args.scrape_runs, workers=args.parse_workers)
+        if args.api_requests:
+            report["api"] = run_api(fakes, args.api_requests, args.concurrency, use_cache=not args.no_cache)
+        report["upstreams"] = {name: asdict(stats) for name, stats in sorted(fakes.stats.items())}
+
+    print(format_report(report))
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,39 +1,84 @@
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
 import sys
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from app.config import settings
+from app.enrich import ContentCache, enrich_items
+from app.retry import FetchPolicy
 from app.scraper import (
+    _get,
     collect_all_sources,
+    configure_fetch_policy,
     fetch_existing_urls,
     format_daily_digest,
+    publish_new_writeups,
     send_discord_message,
     send_telegram_message,
     upsert_items_to_supabase,
 )
 
 
+def _enrich_new_items(new_items: list[dict]) -> list[dict]:
+    # Article pages often share a host with a feed (medium.com), so they get a
+    # separate policy: their failures must not skip tomorrow's feed fetch.
+    policy = FetchPolicy(
+        retry_budget=settings.fetch_retry_budget,
+        failure_threshold=settings.fetch_breaker_threshold,
+        cooldown_seconds=settings.fetch_breaker_cooldown_seconds,
+    )
+    enrichment = enrich_items(
+        new_items,
+        ContentCache(Path(settings.enrich_cache_dir)),
+        partial(_get, policy=policy),
+        max_workers=settings.enrich_concurrency,
+        per_host=settings.enrich_per_host,
+    )
+    empty = {"content_text": None, "reading_time_minutes": None, "tags": []}
+    return [{**item, **enrichment.get(item["url"], empty)} for item in new_items]
+
+
 def main() -> int:
     if not settings.supabase_url or not settings.supabase_service_key:
         raise SystemExit("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY are required")
 
+    configure_fetch_policy(
+        retry_budget=settings.fetch_retry_budget,
+        failure_threshold=settings.fetch_breaker_threshold,
+        cooldown_seconds=settings.fetch_breaker_cooldown_seconds,
+        state_path=Path(settings.fetch_state_path) if settings.fetch_state_path else None,
+    )
     items = collect_all_sources(
-        hackerone_username=getattr(settings, "hackerone_username", ""),
-        hackerone_api_token=getattr(settings, "hackerone_api_token", ""),
+        hackerone_username=settings.hackerone_username,
+        hackerone_api_token=settings.hackerone_api_token,
+        workers=settings.parse_workers,
+        min_date=settings.min_date,
     )
     urls = [item["url"] for item in items]
     existing = fetch_existing_urls(settings.supabase_url, settings.supabase_service_key, urls)
     new_items = [item for item in items if item["url"] not in existing]
 
-    upserted = upsert_items_to_supabase(settings.supabase_url, settings.supabase_service_key, items)
+    if new_items and settings.enrich_articles:
+        # Only new URLs are enriched; they are upserted on their own because a
+        # PostgREST bulk upsert needs the same columns on every row.
+        new_items = _enrich_new_items(new_items)
+        known_items = [item for item in items if item["url"] in existing]
+        upserted = upsert_items_to_supabase(settings.supabase_url, settings.supabase_service_key, known_items)
+        upserted += upsert_items_to_supabase(settings.supabase_url, settings.supabase_service_key, new_items)
+    else:
+        upserted = upsert_items_to_supabase(settings.supabase_url, settings.supabase_service_key, items)
 
     if new_items:
         message = format_daily_digest(new_items)
         send_telegram_message(settings.telegram_bot_token, settings.telegram_chat_id, message)
         send_discord_message(settings.discord_webhook_url, message)
+        try:
+            publish_new_writeups(settings.events_publish_url, settings.events_publish_token, new_items)
+        except Exception as exc:
+            print(f"[warn] failed publishing new writeups to API stream: {exc}")
 
     print(f"Collected: {len(items)} | New: {len(new_items)} | Upserted: {upserted}")
     return 0
@@ -1,6 +1,7 @@
 import importlib.util
 import unittest
 from unittest.mock import MagicMock, patch
+from urllib.parse import unquote_plus
 
 
 FASTAPI_INSTALLED = importlib.util.find_spec("fastapi") is not None
@@ -19,8 +20,12 @@ class ApiTests(unittest.TestCase):
         self.assertEqual(response.json()["status"], "ok")
 
 
-@unittest.skipUnless(FASTAPI_INSTALLED, "fastapi not installed in current environment")
-class KeywordSearchTests(unittest.TestCase):
+class SupabaseApiMixin:
+    def setUp(self):
+        from app.main import _writeups_cache
+
+        _writeups_cache.invalidate()
+
     def _make_client(self):
         from fastapi.testclient import TestClient
         from app.main import app
@@ -38,6 +43,9 @@ class KeywordSearchTests(unittest.TestCase):
         mock_settings.supabase_service_key = "fake-key"
         return patch("app.main.settings", mock_settings)
 
+
+@unittest.skipUnless(FASTAPI_INSTALLED, "fastapi not installed in current environment")
+class KeywordSearchTests(SupabaseApiMixin, unittest.TestCase):
     def test_list_writeups_q_builds_or_filter(self):
         client = self._make_client()
         with self._patch_settings(), patch("app.main.requests.get") as mock_get:
@@ -62,6 +70,216 @@ class KeywordSearchTests(unittest.TestCase):
             called_url = mock_get.call_args[0][0]
         self.assertNotIn("or=", called_url)
 
+    def test_list_writeups_repeated_query_is_served_from_cache(self):
+        client = self._make_client()
+        with self._patch_settings(), patch("app.main.requests.get") as mock_get:
+            mock_get.return_value = self._mock_supabase()
+            client.get("/api/writeups?source=medium")
+            client.get("/api/writeups?source=medium")
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_patch_favorite_invalidates_list_cache(self):
+        client = self._make_client()
+        with (
+            self._patch_settings(),
+            patch("app.main.requests.get") as mock_get,
+            patch("app.main.requests.patch") as mock_patch,
+        ):
+            mock_get.return_value = self._mock_supabase()
+            mock_patch.return_value = self._mock_supabase()
+            client.get("/api/writeups?source=medium")
+            client.patch(
+                "/api/writeups/00000000-0000-0000-0000-000000000001",
+                json={"is_favorite": True},
+            )
+            client.get("/api/writeups?source=medium")
+        self.assertEqual(mock_get.call_count, 2)
+
+
+@unittest.skipUnless(FASTAPI_INSTALLED, "fastapi not installed in current environment")
+class DeltaSyncTests(SupabaseApiMixin, unittest.TestCase):
+    ROW = {
+        "id": "00000000-0000-0000-0000-000000000002",
+        "updated_at": "2026-03-01T10:00:00.5+00:00",
+    }
+
+    def test_changes_without_since_starts_from_the_beginning(self):
+        client = self._make_client()
+        with self._patch_settings(), patch("app.main.requests.get") as mock_get:
+            mock_get.return_value = self._mock_supabase()
+            mock_get.return_value.json.return_value = [self.ROW]
+            response = client.get("/api/writeups/changes?limit=1")
+            called_url = mock_get.call_args[0][0]
+
+        self.assertNotIn("or=", called_url)
+        self.assertIn("order=updated_at.asc%2Cid.asc", called_url)
+        body = response.json()
+        self.assertEqual(body["changes"], [self.ROW])
+        self.assertTrue(body["has_more"])
+        self.assertTrue(body["next"])
+
+    def test_changes_since_token_uses_keyset_filter(self):
+        from app.main import _encode_change_token
+
+        token = _encode_change_token(self.ROW["updated_at"], self.ROW["id"])
+        client = self._make_client()
+        with self._patch_settings(), patch("app.main.requests.get") as mock_get:
+            mock_get.return_value = self._mock_supabase()
+            response = client.get(f"/api/writeups/changes?since={token}")
+            called_url = unquote_plus(mock_get.call_args[0][0])
+
+        self.assertIn(
+            'or=(updated_at.gt."2026-03-01T10:00:00.5+00:00",'
+            'and(updated_at.eq."2026-03-01T10:00:00.5+00:00",id.gt.00000000-0000-0000-0000-000000000002))',
+            called_url,
+        )
+        self.assertEqual(response.json(), {"changes": [], "next": token, "has_more": False})
+
+    def test_changes_hold_back_rows_inside_the_safety_margin(self):
+        from datetime import datetime, timedelta, timezone
+
+        from app.main import CHANGES_SAFETY_MARGIN_SECONDS
+
+        client = self._make_client()
+        before = datetime.now(timezone.utc)
+        with self._patch_settings(), patch("app.main.requests.get") as mock_get:
+            mock_get.return_value = self._mock_supabase()
+            client.get("/api/writeups/changes")
+            called_url = unquote_plus(mock_get.call_args[0][0])
+
+        horizon = datetime.fromisoformat(called_url.split("updated_at=lt.")[1].split("&")[0])
+        margin = timedelta(seconds=CHANGES_SAFETY_MARGIN_SECONDS)
+        self.assertLessEqual(horizon, datetime.now(timezone.utc) - margin)
+        self.assertGreaterEqual(horizon, before - margin)
+
+    def test_changes_rejects_malformed_token(self):
+        client = self._make_client()
+        with self._patch_settings(), patch("app.main.requests.get") as mock_get:
+            response = client.get("/api/writeups/changes?since=not-a-token")
+
+        self.assertEqual(response.status_code, 400)
+        mock_get.assert_not_called()
+
+
+@unittest.skipUnless(FASTAPI_INSTALLED, "fastapi not installed in current environment")
+class BulkUpdateTests(SupabaseApiMixin, unittest.TestCase):
+    IDS = [f"00000000-0000-0000-0000-{i:012d}" for i in range(150)]
+
+    def test_bulk_update_chunks_ids_and_reports_per_id_status(self):
+        def fake_patch(endpoint, headers, json, timeout):
+            response = self._mock_supabase()
+            chunk = endpoint.split("id=in.(")[1].rstrip(")").split(",")
+            response.json.return_value = [{"id": writeup_id} for writeup_id in chunk if writeup_id != self.IDS[3]]
+            return response
+
+        client = self._make_client()
+        with (
+            self._patch_settings(),
+            patch("app.main.requests.patch", side_effect=fake_patch) as mock_patch,
+            patch("app.main._writeups_cache.invalidate") as invalidate,
+        ):
+            response = client.patch("/api/writeups", json={"ids": self.IDS, "is_read": True})
+
+        self.assertEqual(mock_patch.call_count, 2)
+        self.assertEqual(mock_patch.call_args_list[0].kwargs["json"], {"is_read": True})
+        results = response.json()["results"]
+        self.assertEqual(len(results), 150)
+        self.assertEqual(results[3], {"id": self.IDS[3], "status": "not_found"})
+        self.assertEqual(results[4], {"id": self.IDS[4], "status": "updated"})
+        invalidate.assert_called_once()
+
+    def test_bulk_update_reports_failed_chunks(self):
+        import requests
+
+        calls = []
+
+        def flaky_patch(endpoint, headers, json, timeout):
+            calls.append(endpoint)
+            if len(calls) == 2:
+                raise requests.ConnectionError("reset")
+            response = self._mock_supabase()
+            response.json.return_value = [{"id": writeup_id} for writeup_id in self.IDS[:100]]
+            return response
+
+        client = self._make_client()
+        with self._patch_settings(), patch("app.main.requests.patch", side_effect=flaky_patch):
+            response = client.patch("/api/writeups", json={"ids": self.IDS, "is_favorite": False})
+
+        statuses = [result["status"] for result in response.json()["results"]]
+        self.assertEqual(statuses.count("updated"), 100)
+        self.assertEqual(statuses.count("error"), 50)
+
+    def test_bulk_update_marks_chunk_with_malformed_json_as_error(self):
+        def patch_with_bad_body(endpoint, headers, json, timeout):
+            response = self._mock_supabase()
+            response.json.side_effect = ValueError("Expecting value: line 1 column 1 (char 0)")
+            return response
+
+        client = self._make_client()
+        with (
+            self._patch_settings(),
+            patch("app.main.requests.patch", side_effect=patch_with_bad_body),
+            self.assertLogs("app.main", level="WARNING"),
+        ):
+            response = client.patch("/api/writeups", json={"ids": self.IDS[:2], "is_read": True})
+
+        self.assertEqual(response.status_code, 502)
+
+    def test_bulk_update_requires_a_change(self):
+        client = self._make_client()
+        with self._patch_settings(), patch("app.main.requests.patch") as mock_patch:
+            response = client.patch("/api/writeups", json={"ids": self.IDS[:1]})
+
+        self.assertEqual(response.status_code, 422)
+        mock_patch.assert_not_called()
+
+
+@unittest.skipUnless(FASTAPI_INSTALLED, "fastapi not installed in current environment")
+class PublishWriteupsTests(SupabaseApiMixin, unittest.TestCase):
+    def _patch_settings(self):
+        mock_settings = MagicMock()
+        mock_settings.events_publish_token = "publish-secret"
+        return patch("app.main.settings", mock_settings)
+
+    def test_publish_requires_token(self):
+        client = self._make_client()
+        with self._patch_settings():
+            response = client.post("/api/writeups/events", json={"items": []}, headers={"Authorization": "Bearer nope"})
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_publish_rejects_non_ascii_token(self):
+        client = self._make_client()
+        with self._patch_settings():
+            response = client.post(
+                "/api/writeups/events",
+                json={"items": []},
+                headers={"Authorization": "Bearer \xe9".encode("latin-1")},
+            )
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_publish_broadcasts_items_and_invalidates_list_cache(self):
+        from app.main import _broadcaster, _writeups_cache
+
+        subscriber = _broadcaster.subscribe()
+        client = self._make_client()
+        try:
+            with self._patch_settings(), patch.object(_writeups_cache, "invalidate") as invalidate:
+                response = client.post(
+                    "/api/writeups/events",
+                    json={"items": [{"url": "https://example.com/new", "content_text": "x" * 20_000}]},
+                    headers={"Authorization": "Bearer publish-secret"},
+                )
+        finally:
+            _broadcaster.unsubscribe(subscriber)
+
+        self.assertEqual(response.status_code, 202)
+        invalidate.assert_called_once()
+        _, event, data = subscriber.queue.get_nowait()
+        self.assertEqual(event, "writeups")
+        self.assertEqual(data, [{"url": "https://example.com/new"}])
+
 
 if __name__ == "__main__":
     unittest.main()
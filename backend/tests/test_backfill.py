@@ -0,0 +1,178 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import importlib.util
+import json
+from pathlib import Path
+import tempfile
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.backfill import CheckpointStore, _hackerone_next_link, run_backfill
+from app import scraper
+from app.scraper import upsert_items_to_supabase
+
+SINCE = datetime(2024, 3, 1, tzinfo=timezone.utc)
+UNTIL = datetime(2024, 3, 3, tzinfo=timezone.utc)
+
+
+def _medium_archive_page(slug: str) -> str:
+    return f'<div><a href="/@author/{slug}-0123456789ab?source=tag"><h2>{slug}</h2></a></div>'
+
+
+class BackfillTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.checkpoint = Path(self.tmp.name) / "checkpoint.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, fetch, upserted, **kwargs):
+        store = CheckpointStore(self.checkpoint, SINCE, UNTIL)
+        totals = run_backfill(
+            store,
+            SINCE,
+            UNTIL,
+            {"medium": fetch},
+            upsert=lambda items: upserted.extend(items) or len(items),
+            sleep=lambda _: None,
+            **kwargs,
+        )
+        return store, totals
+
+    def test_medium_backfill_walks_each_archive_day(self):
+        fetched, upserted = [], []
+
+        def fetch(url):
+            fetched.append(url)
+            return _medium_archive_page(f"post-{len(fetched)}")
+
+        store, totals = self._run(fetch, upserted)
+
+        self.assertEqual(
+            fetched,
+            [
+                "https://medium.com/tag/bug-bounty/archive/2024/03/01",
+                "https://medium.com/tag/bug-bounty/archive/2024/03/02",
+                "https://medium.com/tag/bug-bounty/archive/2024/03/03",
+            ],
+        )
+        self.assertEqual(totals, {"medium": 3})
+        self.assertEqual(upserted[0]["url"], "https://medium.com/@author/post-1-0123456789ab")
+        self.assertEqual(upserted[1]["published_at"], datetime(2024, 3, 2, tzinfo=timezone.utc))
+        self.assertTrue(store.state("medium")["done"])
+
+    def test_backfill_resumes_from_checkpoint_after_failure(self):
+        fetched, upserted = [], []
+
+        def flaky_fetch(url):
+            fetched.append(url)
+            if len(fetched) == 2:
+                raise RuntimeError("connection reset")
+            return _medium_archive_page(f"post-{len(fetched)}")
+
+        self._run(flaky_fetch, upserted)
+        saved = json.loads(self.checkpoint.read_text())
+        self.assertEqual(saved["sources"]["medium"]["cursor"], "2024-03-02T00:00:00+00:00")
+        self.assertFalse(saved["sources"]["medium"]["done"])
+
+        fetched.clear()
+        store, _ = self._run(lambda url: fetched.append(url) or _medium_archive_page("later"), upserted)
+
+        self.assertEqual(fetched[0], "https://medium.com/tag/bug-bounty/archive/2024/03/02")
+        self.assertEqual(len(fetched), 2)
+        self.assertTrue(store.state("medium")["done"])
+
+    def test_completed_source_is_skipped_on_rerun(self):
+        upserted = []
+        self._run(lambda url: _medium_archive_page("p"), upserted)
+        fetched = []
+
+        self._run(lambda url: fetched.append(url) or "", upserted)
+
+        self.assertEqual(fetched, [])
+
+    def test_checkpoint_for_another_range_is_ignored(self):
+        self.checkpoint.write_text(json.dumps({"range": ["x", "y"], "sources": {"medium": {"done": True}}}))
+
+        store = CheckpointStore(self.checkpoint, SINCE, UNTIL)
+
+        self.assertFalse(store.state("medium")["done"])
+
+    def test_one_parse_pool_serves_the_whole_walk(self):
+        pools = []
+
+        class CountingPool(ThreadPoolExecutor):
+            def __init__(self, max_workers):
+                super().__init__(max_workers=max_workers)
+                pools.append(self)
+
+        upserted = []
+        with patch("concurrent.futures.ProcessPoolExecutor", CountingPool):
+            _, totals = self._run(lambda url: _medium_archive_page(url.rsplit("/", 1)[-1]), upserted, workers=2)
+
+        self.assertEqual(totals, {"medium": 3})
+        self.assertEqual(len(pools), 1)
+
+    def test_hackerone_next_link_is_read_without_decoding_the_page(self):
+        page = json.dumps(
+            {
+                "data": [{"id": 1, "links": {"self": "https://api.example/1"}}],
+                "links": {"self": "https://api.example/p1", "next": "https://api.example/p2"},
+            }
+        )
+
+        self.assertEqual(_hackerone_next_link(page), "https://api.example/p2")
+        self.assertIsNone(_hackerone_next_link(json.dumps({"data": [], "links": {"self": "https://api.example/p2"}})))
+        self.assertIsNone(_hackerone_next_link("not json"))
+
+    def test_backfill_upserts_never_overwrite_stored_rows(self):
+        response = MagicMock()
+        response.raise_for_status.return_value = None
+        item = {"source": "medium", "title": "t", "url": "https://medium.com/p", "published_at": SINCE}
+
+        with patch("requests.post", return_value=response) as post:
+            upsert_items_to_supabase("https://db.example.com", "key", [item], ignore_duplicates=True)
+            upsert_items_to_supabase("https://db.example.com", "key", [item])
+
+        self.assertIn("resolution=ignore-duplicates", post.call_args_list[0].kwargs["headers"]["Prefer"])
+        self.assertIn("resolution=merge-duplicates", post.call_args_list[1].kwargs["headers"]["Prefer"])
+
+
+class BackfillScriptTests(unittest.TestCase):
+    def test_backfill_fetches_do_not_share_the_daily_breakers(self):
+        module_path = Path(__file__).resolve().parents[1] / "scripts" / "backfill.py"
+        spec = importlib.util.spec_from_file_location("backfill_script", module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        module.settings = types.SimpleNamespace(
+            supabase_url="https://db.example.com",
+            supabase_service_key="secret",
+            hackerone_username="",
+            hackerone_api_token="",
+            min_date="2025-01-01T00:00:00+00:00",
+            parse_workers=1,
+            fetch_retry_budget=20,
+            fetch_breaker_threshold=3,
+            fetch_breaker_cooldown_seconds=72000,
+        )
+
+        with tempfile.TemporaryDirectory() as tmp, patch.object(module, "run_backfill", return_value={}) as run:
+            state_path = Path(tmp) / "breakers.json"
+            module.main(
+                [
+                    "--since=2024-01-01",
+                    "--sources=medium",
+                    f"--checkpoint={Path(tmp) / 'checkpoint.json'}",
+                    f"--breaker-state={state_path}",
+                ]
+            )
+
+        policy = run.call_args[0][3]["medium"].keywords["policy"]
+        self.assertIsNot(policy, scraper.fetch_policy)
+        self.assertEqual(policy.state_path, state_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import threading
+import time
+import unittest
+
+from app.cache import SingleFlightCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SingleFlightCacheTests(unittest.TestCase):
+    def test_concurrent_identical_gets_share_one_load(self):
+        cache = SingleFlightCache(ttl_seconds=30)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return ["row"]
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get("k", loader))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        started.wait(timeout=5)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [["row"]] * 8)
+
+    def test_fresh_entry_is_served_without_loading(self):
+        clock = FakeClock()
+        cache = SingleFlightCache(ttl_seconds=30, clock=clock)
+        cache.get("k", lambda: "first")
+        clock.now = 10
+
+        self.assertEqual(cache.get("k", lambda: "second"), "first")
+
+    def test_stale_entry_is_served_while_refreshing_in_background(self):
+        clock = FakeClock()
+        cache = SingleFlightCache(ttl_seconds=30, stale_seconds=60, clock=clock)
+        cache.get("k", lambda: "first")
+        clock.now = 45
+        refreshed = threading.Event()
+
+        def loader():
+            refreshed.set()
+            return "second"
+
+        self.assertEqual(cache.get("k", loader), "first")
+        self.assertTrue(refreshed.wait(timeout=5))
+        for _ in range(100):
+            if cache.get("k", lambda: "unused") == "second":
+                break
+            time.sleep(0.01)
+        self.assertEqual(cache.get("k", lambda: "unused"), "second")
+
+    def test_expired_entry_blocks_on_reload(self):
+        clock = FakeClock()
+        cache = SingleFlightCache(ttl_seconds=30, stale_seconds=60, clock=clock)
+        cache.get("k", lambda: "first")
+        clock.now = 100
+
+        self.assertEqual(cache.get("k", lambda: "second"), "second")
+
+    def test_errors_are_propagated_and_not_cached(self):
+        cache = SingleFlightCache(ttl_seconds=30)
+
+        def failing():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            cache.get("k", failing)
+        self.assertEqual(cache.get("k", lambda: "ok"), "ok")
+
+    def test_invalidate_drops_entries(self):
+        cache = SingleFlightCache(ttl_seconds=30)
+        cache.get("k", lambda: "first")
+        cache.invalidate()
+
+        self.assertEqual(cache.get("k", lambda: "second"), "second")
+
+    def test_least_recently_used_entries_are_evicted_beyond_max_entries(self):
+        cache = SingleFlightCache(ttl_seconds=30, max_entries=2)
+        cache.get("a", lambda: "a1")
+        cache.get("b", lambda: "b1")
+        cache.get("a", lambda: "unused")
+        cache.get("c", lambda: "c1")
+
+        self.assertEqual(cache.get("a", lambda: "a2"), "a1")
+        self.assertEqual(cache.get("b", lambda: "b2"), "b2")
+
+    def test_many_distinct_keys_stay_bounded(self):
+        cache = SingleFlightCache(ttl_seconds=30, max_entries=50)
+        for i in range(1000):
+            cache.get(f"q={i}", lambda: i)
+
+        self.assertEqual(len(cache._entries), 50)
+
+    def test_expired_entries_are_dropped_on_write(self):
+        clock = FakeClock()
+        cache = SingleFlightCache(ttl_seconds=30, stale_seconds=60, clock=clock)
+        cache.get("old", lambda: "v")
+        clock.now = 100
+        cache.get("new", lambda: "v")
+
+        self.assertEqual(list(cache._entries), ["new"])
+
+
+if __name__ == "__main__":
+    unittest.main()
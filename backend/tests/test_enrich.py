@@ -0,0 +1,93 @@
+from pathlib import Path
+import tempfile
+import threading
+import time
+import unittest
+
+from app.enrich import ContentCache, enrich_items, extract_article
+
+ARTICLE_HTML = """
+<html><head>
+  <meta property="article:tag" content="SSRF">
+  <meta name="keywords" content="ssrf, Bug Bounty">
+  <script>var tracking = 1;</script>
+</head><body>
+  <nav>Home | Login</nav>
+  <article><h1>Finding SSRF</h1><p>First paragraph here.</p><p>Second &amp; last.</p>
+  <a rel="tag" href="/t/cloud">Cloud</a></article>
+  <footer>Copyright</footer>
+</body></html>
+"""
+
+
+class ExtractArticleTests(unittest.TestCase):
+    def test_extracts_article_text_reading_time_and_tags(self):
+        result = extract_article(ARTICLE_HTML)
+
+        self.assertEqual(result["content_text"], "Finding SSRF\nFirst paragraph here.\nSecond & last.\nCloud")
+        self.assertEqual(result["reading_time_minutes"], 1)
+        self.assertEqual(result["tags"], ["SSRF", "Bug Bounty", "Cloud"])
+
+    def test_empty_page_has_no_reading_time(self):
+        result = extract_article("<html><body><script>x()</script></body></html>")
+
+        self.assertIsNone(result["content_text"])
+        self.assertIsNone(result["reading_time_minutes"])
+
+
+class EnrichItemsTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ContentCache(Path(self.tmp.name))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_cached_pages_are_not_refetched(self):
+        fetched = []
+        items = [{"url": "https://example.com/a"}, {"url": "https://example.com/b"}]
+
+        def fetch(url):
+            fetched.append(url)
+            return ARTICLE_HTML
+
+        first = enrich_items(items, self.cache, fetch=fetch)
+        second = enrich_items(items, self.cache, fetch=fetch)
+
+        self.assertEqual(sorted(fetched), ["https://example.com/a", "https://example.com/b"])
+        self.assertEqual(first, second)
+        self.assertEqual(len(list((Path(self.tmp.name) / "blobs").rglob("*"))), 2)
+
+    def test_per_host_limit_bounds_concurrent_fetches(self):
+        lock = threading.Lock()
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        def fetch(url):
+            host = url.split("/")[2]
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+            return ARTICLE_HTML
+
+        items = [{"url": f"https://{host}/{i}"} for host in ("a.example", "b.example") for i in range(6)]
+        result = enrich_items(items, self.cache, max_workers=8, per_host=2, fetch=fetch)
+
+        self.assertEqual(len(result), 12)
+        self.assertLessEqual(max(peak.values()), 2)
+
+    def test_failed_fetches_are_skipped_and_not_cached(self):
+        def fetch(url):
+            raise RuntimeError("404")
+
+        result = enrich_items([{"url": "https://example.com/missing"}], self.cache, fetch=fetch)
+
+        self.assertEqual(result, {})
+        self.assertIsNone(self.cache.get("https://example.com/missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import asyncio
+import unittest
+
+from app.events import Broadcaster, format_sse, sse_stream
+
+
+def _drain(subscriber):
+    events = []
+    while not subscriber.queue.empty():
+        events.append(subscriber.queue.get_nowait())
+    return events
+
+
+class BroadcasterTests(unittest.TestCase):
+    def test_publish_reaches_every_subscriber(self):
+        broadcaster = Broadcaster(buffer_size=4)
+        first, second = broadcaster.subscribe(), broadcaster.subscribe()
+
+        broadcaster.publish("writeups", [{"url": "https://example.com/a"}])
+
+        self.assertEqual(_drain(first), [(1, "writeups", [{"url": "https://example.com/a"}])])
+        self.assertEqual(_drain(second), [(1, "writeups", [{"url": "https://example.com/a"}])])
+
+    def test_slow_subscriber_is_told_to_resync_instead_of_blocking(self):
+        broadcaster = Broadcaster(buffer_size=2)
+        slow = broadcaster.subscribe()
+
+        for i in range(5):
+            broadcaster.publish("writeups", [i])
+
+        events = _drain(slow)
+        self.assertEqual([event for _, event, _ in events], ["resync", "writeups"])
+        self.assertEqual(events[-1], (5, "writeups", [4]))
+        self.assertGreater(slow.dropped, 0)
+
+    def test_unsubscribed_clients_receive_nothing(self):
+        broadcaster = Broadcaster()
+        subscriber = broadcaster.subscribe()
+        broadcaster.unsubscribe(subscriber)
+
+        broadcaster.publish("writeups", [])
+
+        self.assertEqual(_drain(subscriber), [])
+        self.assertEqual(broadcaster.subscriber_count, 0)
+
+
+class SseStreamTests(unittest.TestCase):
+    def test_stream_formats_events_and_heartbeats(self):
+        async def scenario():
+            broadcaster = Broadcaster()
+            subscriber = broadcaster.subscribe()
+            broadcaster.publish("writeups", [{"title": "A"}])
+            checks = iter([False, False, False, True])
+
+            async def is_disconnected():
+                return next(checks)
+
+            return [chunk async for chunk in sse_stream(subscriber, is_disconnected, heartbeat_seconds=0.01)]
+
+        chunks = asyncio.run(scenario())
+
+        self.assertEqual(
+            chunks,
+            ["retry: 5000\n\n", format_sse(1, "writeups", [{"title": "A"}]), ": keep-alive\n\n", ": keep-alive\n\n"],
+        )
+        self.assertEqual(chunks[1], 'id: 1\nevent: writeups\ndata: [{"title":"A"}]\n\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
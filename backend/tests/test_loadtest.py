@@ -0,0 +1,55 @@
+import importlib.util
+from pathlib import Path
+import sys
+import unittest
+
+
+FASTAPI_INSTALLED = importlib.util.find_spec("fastapi") is not None
+
+
+def _load_loadtest_module():
+    module_path = Path(__file__).resolve().parents[1] / "scripts" / "loadtest.py"
+    spec = importlib.util.spec_from_file_location("loadtest", module_path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    sys.modules[spec.name] = module  # dataclasses resolve their module through sys.modules
+    spec.loader.exec_module(module)
+    return module
+
+
+class LoadTestHarnessTests(unittest.TestCase):
+    def setUp(self):
+        self.loadtest = _load_loadtest_module()
+
+    def test_scrape_runs_against_stand_ins_and_only_first_run_notifies(self):
+        with self.loadtest.FakeUpstreams({}, feed_items=5, h1_pages=2) as fakes:
+            report = self.loadtest.run_scrape(fakes, runs=2)
+            stats = dict(fakes.stats)
+
+        self.assertEqual(report["failed_runs"], 0)
+        self.assertEqual(report["rows_stored"], 20)
+        self.assertEqual(stats["rss"].requests, 4)
+        self.assertEqual(stats["telegram"].requests, 1)
+        self.assertEqual(stats["discord"].requests, 1)
+
+    def test_injected_429s_are_retried_and_reported(self):
+        faults = {"rss": self.loadtest.Faults(rate_limit_rate=0.5)}
+        with self.loadtest.FakeUpstreams(faults, feed_items=3, h1_pages=1, seed=1) as fakes:
+            report = self.loadtest.run_scrape(fakes, runs=3)
+            rss = fakes.stats["rss"]
+
+        self.assertGreater(rss.injected_429s, 0)
+        self.assertEqual(report["retry_sleeps"], rss.injected_429s)
+
+    @unittest.skipUnless(FASTAPI_INSTALLED, "fastapi not installed in current environment")
+    def test_api_load_reports_latency_percentiles(self):
+        with self.loadtest.FakeUpstreams({}, feed_items=3, h1_pages=1) as fakes:
+            self.loadtest.run_scrape(fakes, runs=1)
+            report = self.loadtest.run_api(fakes, requests_total=30, concurrency=4)
+
+        self.assertEqual(report["statuses"], {"200": 30})
+        self.assertLessEqual(report["p50_ms"], report["p99_ms"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,7 +8,9 @@ from app.scraper import (
     dedupe_items,
     fetch_hackerone_hacktivity_api,
     filter_recent_items,
+    parse_bodies,
     parse_hackerone_hacktivity_api,
+    parse_html_listing,
     parse_rss_items,
 )
 
@@ -78,6 +80,33 @@ class ParserTests(unittest.TestCase):
         self.assertEqual(items[0]["url"], "https://hackerone.com/reports/4321")
         self.assertEqual(items[0]["title"], "API report title")
 
+    def test_parse_bodies_in_process_pool_matches_inline_parsing(self):
+        jobs = [
+            (
+                "rss",
+                "medium",
+                f"<rss><channel><item><title>W{i}</title><link>https://example.com/w{i}</link>"
+                "<pubDate>Mon, 15 Jan 2026 10:00:00 GMT</pubDate></item></channel></rss>",
+            )
+            for i in range(6)
+        ]
+        jobs.append(
+            (
+                "hackerone",
+                "hackerone",
+                '{"data": [{"attributes": {"title": "H1", "url": "https://hackerone.com/reports/1",'
+                ' "disclosed_at": "2026-02-18T11:00:00Z"}}]}',
+            )
+        )
+        jobs.append(("hackerone", "hackerone", "not json"))
+
+        inline = list(parse_bodies(jobs))
+        pooled = list(parse_bodies(jobs, workers=2))
+
+        self.assertEqual(pooled, inline)
+        self.assertEqual(len(inline), 7)
+        self.assertEqual(inline[-1]["source"], "hackerone")
+
     def test_fetch_hackerone_hacktivity_api_uses_disclosed_true_filter(self):
         response = MagicMock()
         response.raise_for_status.return_value = None
@@ -110,6 +139,35 @@ class ParserTests(unittest.TestCase):
         self.assertEqual(MIN_DATE.isoformat(), "2025-01-01T00:00:00+00:00")
         self.assertEqual([x["url"] for x in filtered], ["https://example.com/new"])
 
+    def test_filter_recent_items_accepts_custom_min_date(self):
+        items = [
+            {"url": "https://example.com/old", "published_at": datetime(2023, 6, 1, tzinfo=timezone.utc)},
+            {"url": "https://example.com/older", "published_at": datetime(2021, 6, 1, tzinfo=timezone.utc)},
+        ]
+
+        filtered = filter_recent_items(items, min_date=datetime(2022, 1, 1, tzinfo=timezone.utc))
+
+        self.assertEqual([x["url"] for x in filtered], ["https://example.com/old"])
+
+    def test_parse_html_listing_pairs_links_with_time_elements(self):
+        html = """
+        <ul>
+          <li><a href="/research/first-post">First post</a><time datetime="2023-05-01">1 May</time></li>
+          <li><time datetime="2022-02-02">2 Feb</time><a href="https://portswigger.net/research/second-post">Second</a></li>
+          <li><a href="/research/articles">All articles</a></li>
+        </ul>
+        """
+
+        items = parse_html_listing(html, source="portswigger")
+
+        self.assertEqual(
+            [(x["url"], x["published_at"][:10]) for x in items],
+            [
+                ("https://portswigger.net/research/first-post", "2023-05-01"),
+                ("https://portswigger.net/research/second-post", "2022-02-02"),
+            ],
+        )
+
     def test_dedupe_items_keeps_first_url_only(self):
         now = datetime(2026, 1, 1, tzinfo=timezone.utc)
         items = [
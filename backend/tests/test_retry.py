@@ -0,0 +1,166 @@
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from app import scraper
+from app.retry import CircuitOpenError, FetchPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FetchPolicyTests(unittest.TestCase):
+    def test_breaker_opens_after_threshold_and_reopens_with_longer_cooldown(self):
+        clock = FakeClock()
+        policy = FetchPolicy(failure_threshold=2, cooldown_seconds=60, clock=clock)
+
+        policy.record_failure("feeds.example")
+        policy.check("feeds.example")
+        policy.record_failure("feeds.example")
+        with self.assertRaises(CircuitOpenError):
+            policy.check("feeds.example")
+
+        clock.now += 61
+        policy.check("feeds.example")
+        policy.record_failure("feeds.example")
+        clock.now += 61
+        with self.assertRaises(CircuitOpenError):
+            policy.check("feeds.example")
+        clock.now += 60
+        policy.check("feeds.example")
+
+    def test_success_closes_breaker(self):
+        policy = FetchPolicy(failure_threshold=1, cooldown_seconds=60, clock=FakeClock())
+        policy.record_failure("feeds.example")
+        policy.record_success("feeds.example")
+
+        policy.check("feeds.example")
+
+    def test_breaker_state_persists_between_runs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = Path(tmp) / "breakers.json"
+            clock = FakeClock()
+            FetchPolicy(failure_threshold=1, cooldown_seconds=60, state_path=state_path, clock=clock).record_failure("down.example")
+
+            next_run = FetchPolicy(failure_threshold=1, state_path=state_path, clock=clock)
+
+            with self.assertRaises(CircuitOpenError):
+                next_run.check("down.example")
+
+    def test_backoff_is_jittered_and_honours_retry_after(self):
+        policy = FetchPolicy(base_delay_seconds=2, max_delay_seconds=30, rng=lambda: 0.5)
+
+        self.assertEqual(policy.backoff(0), 1.5)
+        self.assertEqual(policy.backoff(10), 22.5)
+        self.assertEqual(policy.backoff(0, retry_after=7), 7)
+
+    def test_backoff_keeps_half_the_exponential_delay(self):
+        policy = FetchPolicy(base_delay_seconds=2, max_delay_seconds=30, rng=lambda: 0)
+
+        self.assertEqual([policy.backoff(attempt) for attempt in range(3)], [1.0, 2.0, 4.0])
+
+    def test_retry_budget_is_shared(self):
+        policy = FetchPolicy(retry_budget=2)
+
+        self.assertEqual([policy.take_retry() for _ in range(3)], [True, True, False])
+
+
+class GetWithPolicyTests(unittest.TestCase):
+    def setUp(self):
+        self.original_policy = scraper.fetch_policy
+
+    def tearDown(self):
+        scraper.fetch_policy = self.original_policy
+
+    def _failing_get(self):
+        return MagicMock(side_effect=requests.ConnectionError("down"))
+
+    def test_open_breaker_skips_the_request(self):
+        scraper.configure_fetch_policy(failure_threshold=1, cooldown_seconds=60, rng=lambda: 0)
+        with patch("app.scraper.requests.get", self._failing_get()) as get_mock, patch("app.scraper.time.sleep"):
+            with self.assertRaises(requests.ConnectionError):
+                scraper._get("https://down.example/feed")
+            attempts = get_mock.call_count
+            with self.assertRaises(CircuitOpenError):
+                scraper._get("https://down.example/other")
+
+        self.assertEqual(attempts, 4)
+        self.assertEqual(get_mock.call_count, 4)
+
+    def test_short_blip_does_not_open_the_breaker(self):
+        scraper.configure_fetch_policy(rng=lambda: 0)
+        response = MagicMock(status_code=200, text="<rss/>")
+        sleeps = []
+        outage = [requests.ConnectionError("reset")] * 3
+        with (
+            patch("app.scraper.requests.get", side_effect=[*outage, response]),
+            patch("app.scraper.time.sleep", side_effect=sleeps.append),
+        ):
+            body = scraper._get("https://medium.com/feed/tag/bug-bounty")
+
+        self.assertEqual(body, "<rss/>")
+        self.assertEqual(sum(sleeps), 7.0)
+        self.assertNotIn("medium.com", scraper.fetch_policy._hosts)
+        scraper.fetch_policy.check("medium.com")
+
+    def test_half_open_trial_is_a_single_attempt(self):
+        clock = FakeClock()
+        scraper.configure_fetch_policy(failure_threshold=1, cooldown_seconds=60, clock=clock, rng=lambda: 0)
+        with patch("app.scraper.requests.get", self._failing_get()) as get_mock, patch("app.scraper.time.sleep"):
+            with self.assertRaises(requests.ConnectionError):
+                scraper._get("https://down.example/feed")
+            clock.now += 61
+            with self.assertRaises(requests.ConnectionError):
+                scraper._get("https://down.example/feed")
+
+        self.assertEqual(get_mock.call_count, 5)
+        self.assertEqual(scraper.fetch_policy.retries_left, 17)
+
+    def test_dead_host_is_skipped_by_later_daily_runs(self):
+        day = 24 * 3600
+        clock = FakeClock()
+        attempts_per_run = []
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = Path(tmp) / "breakers.json"
+            for _ in range(10):
+                # Each daily run starts a fresh process that restores the persisted state.
+                scraper.configure_fetch_policy(state_path=state_path, clock=clock, rng=lambda: 0)
+                with patch("app.scraper.requests.get", self._failing_get()) as get_mock, patch("app.scraper.time.sleep"):
+                    with self.assertRaises((requests.ConnectionError, CircuitOpenError)):
+                        scraper._get("https://down.example/feed")
+                attempts_per_run.append(get_mock.call_count)
+                clock.now += day
+
+        # Three failed runs open the breaker; afterwards the host only gets
+        # single-request trials, spaced further apart as it stays down.
+        self.assertEqual(attempts_per_run, [4, 4, 4, 1, 0, 1, 0, 0, 0, 1])
+
+    def test_exhausted_budget_stops_retrying(self):
+        scraper.configure_fetch_policy(retry_budget=1, rng=lambda: 0)
+        with patch("app.scraper.requests.get", self._failing_get()) as get_mock, patch("app.scraper.time.sleep"):
+            for url in ("https://a.example/feed", "https://b.example/feed"):
+                with self.assertRaises(requests.ConnectionError):
+                    scraper._get(url)
+
+        self.assertEqual(get_mock.call_count, 3)
+
+    def test_client_errors_do_not_trip_the_breaker(self):
+        scraper.configure_fetch_policy(failure_threshold=1)
+        response = MagicMock(status_code=404)
+        response.raise_for_status.side_effect = requests.HTTPError("404", response=response)
+        with patch("app.scraper.requests.get", return_value=response):
+            for _ in range(2):
+                with self.assertRaises(requests.HTTPError):
+                    scraper._get("https://up.example/missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,12 @@
+from dataclasses import replace
 import importlib.util
 from pathlib import Path
-import types
+import tempfile
 import unittest
 from unittest.mock import patch
 
+from app.config import Settings
+
 
 def _load_scrape_module():
     module_path = Path(__file__).resolve().parents[1] / "scripts" / "scrape_and_notify.py"
@@ -14,10 +17,23 @@ def _load_scrape_module():
     return module
 
 
+def _settings(**overrides):
+    # Real defaults, with everything that reaches outside the test switched off.
+    isolated = {
+        "fetch_state_path": "",
+        "enrich_articles": False,
+        "events_publish_url": "",
+        "events_publish_token": "",
+        "hackerone_username": "",
+        "hackerone_api_token": "",
+    }
+    return replace(Settings(), **{**isolated, **overrides})
+
+
 class ScrapeAndNotifyTests(unittest.TestCase):
     def test_no_notifications_when_no_new_items(self):
         module = _load_scrape_module()
-        module.settings = types.SimpleNamespace(
+        module.settings = _settings(
             supabase_url="https://db.example.com",
             supabase_service_key="secret",
             telegram_bot_token="tg",
@@ -43,14 +59,14 @@ class ScrapeAndNotifyTests(unittest.TestCase):
 
     def test_notifications_when_there_are_new_items(self):
         module = _load_scrape_module()
-        module.settings = types.SimpleNamespace(
+        module.settings = _settings(
             supabase_url="https://db.example.com",
             supabase_service_key="secret",
             telegram_bot_token="tg",
             telegram_chat_id="chat",
             discord_webhook_url="https://discord.example.com/webhook",
         )
-        new_item = {"url": "https://example.com/new", "title": "N"}
+        new_item = {"url": "https://example.com/new", "title": "N", "source": "medium"}
 
         with (
             patch.object(module, "collect_all_sources", return_value=[new_item]),
@@ -59,14 +75,102 @@ class ScrapeAndNotifyTests(unittest.TestCase):
             patch.object(module, "format_daily_digest", return_value="msg") as digest,
             patch.object(module, "send_telegram_message") as telegram,
             patch.object(module, "send_discord_message") as discord,
+            patch.object(module, "publish_new_writeups") as publish,
         ):
             code = module.main()
 
         self.assertEqual(code, 0)
+        publish.assert_called_once_with("", "", [new_item])
         digest.assert_called_once()
         telegram.assert_called_once_with("tg", "chat", "msg")
         discord.assert_called_once_with("https://discord.example.com/webhook", "msg")
 
+    def test_enrichment_only_fetches_new_items(self):
+        module = _load_scrape_module()
+        module.settings = _settings(
+            supabase_url="https://db.example.com",
+            supabase_service_key="secret",
+            telegram_bot_token="",
+            telegram_chat_id="",
+            discord_webhook_url="",
+            enrich_articles=True,
+            enrich_cache_dir="/tmp/unused",
+            enrich_concurrency=4,
+            enrich_per_host=2,
+        )
+        old_item = {"url": "https://example.com/old", "title": "O", "source": "medium"}
+        new_item = {"url": "https://example.com/new", "title": "N", "source": "medium"}
+        enrichment = {"content_text": "body", "reading_time_minutes": 1, "tags": ["xss"]}
+
+        with (
+            patch.object(module, "collect_all_sources", return_value=[old_item, new_item]),
+            patch.object(module, "fetch_existing_urls", return_value={"https://example.com/old"}),
+            patch.object(module, "enrich_items", return_value={"https://example.com/new": enrichment}) as enrich,
+            patch.object(module, "upsert_items_to_supabase", side_effect=lambda url, key, rows: len(rows)) as upsert,
+            patch.object(module, "send_telegram_message"),
+            patch.object(module, "send_discord_message"),
+        ):
+            code = module.main()
+
+        self.assertEqual(code, 0)
+        self.assertEqual(enrich.call_args[0][0], [new_item])
+        self.assertEqual(upsert.call_args_list[0][0][2], [old_item])
+        self.assertEqual(upsert.call_args_list[1][0][2], [{**new_item, **enrichment}])
+
+    def test_enrichment_does_not_share_the_feed_breakers(self):
+        import requests
+
+        from app import scraper
+
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        module = _load_scrape_module()
+        module.settings = _settings(
+            enrich_cache_dir=cache_dir.name,
+            enrich_concurrency=4,
+            enrich_per_host=2,
+        )
+        feed_policy = scraper.fetch_policy
+        retries_before = feed_policy.retries_left
+        items = [{"url": f"https://medium.com/@a/post-{n}", "title": "T", "source": "medium"} for n in range(4)]
+
+        with (
+            patch("requests.get", side_effect=requests.ConnectionError("down")),
+            patch.object(scraper.time, "sleep"),
+        ):
+            enriched = module._enrich_new_items(items)
+
+        self.assertEqual([item["content_text"] for item in enriched], [None] * 4)
+        feed_policy.check("medium.com")
+        self.assertNotIn("medium.com", feed_policy._hosts)
+        self.assertEqual(feed_policy.retries_left, retries_before)
+
+
+class PublishNewWriteupsTests(unittest.TestCase):
+    def test_only_list_row_fields_are_published(self):
+        from datetime import datetime, timezone
+        import json
+
+        from app.scraper import publish_new_writeups
+
+        item = {
+            "source": "medium",
+            "title": "T",
+            "url": "https://example.com/new",
+            "author": None,
+            "summary": "S",
+            "published_at": datetime(2026, 3, 1, tzinfo=timezone.utc),
+            "content_text": "x" * 20_000,
+            "reading_time_minutes": 100,
+            "tags": ["xss"],
+        }
+        with patch("requests.post") as post:
+            publish_new_writeups("https://api.example.com/api/writeups/events", "token", [item])
+
+        (row,) = json.loads(post.call_args.kwargs["data"])["items"]
+        self.assertEqual(set(row), {"source", "title", "url", "author", "summary", "published_at"})
+        self.assertEqual(row["published_at"], "2026-03-01T00:00:00+00:00")
+
 
 if __name__ == "__main__":
     unittest.main()
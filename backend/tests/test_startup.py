@@ -0,0 +1,112 @@
+import importlib.util
+from pathlib import Path
+import subprocess
+import sys
+import unittest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+FASTAPI_INSTALLED = importlib.util.find_spec("fastapi") is not None
+
+# Ceilings on cumulative import time, with headroom for noisy CI machines; the
+# module lists below pin the heavy dependencies that must stay off the cold path.
+SCRIPT_IMPORT_BUDGET_US = 80_000
+# Only needed with PARSE_WORKERS > 1 or ENRICH_ARTICLES on.
+SCRIPT_DEFERRED_MODULES = ("multiprocessing", "concurrent.futures", "concurrent.futures.process")
+API_OWN_MODULES_BUDGET_US = 50_000
+
+
+def _import_times(statement: str) -> dict[str, tuple[int, int]]:
+    """Run ``statement`` under ``-X importtime`` and return {module: (self_us, cumulative_us)}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+class StartupTests(unittest.TestCase):
+    def test_scrape_script_import_skips_heavy_modules(self):
+        times = _import_times("import sys; sys.path.insert(0, 'scripts'); import scrape_and_notify")
+
+        for heavy in ("requests", "fastapi", "pydantic", *SCRIPT_DEFERRED_MODULES):
+            self.assertNotIn(heavy, times)
+        self.assertLess(times["scrape_and_notify"][1], SCRIPT_IMPORT_BUDGET_US)
+
+    def test_config_import_does_not_read_settings(self):
+        times = _import_times("import app.config, sys; assert 'settings' not in vars(sys.modules['app.config'])")
+
+        self.assertIn("app.config", times)
+
+    @unittest.skipUnless(FASTAPI_INSTALLED, "fastapi not installed in current environment")
+    def test_api_import_defers_requests(self):
+        times = _import_times("import app.main")
+
+        self.assertNotIn("requests", times)
+        own_modules_us = sum(self_us for module, (self_us, _) in times.items() if module.startswith("app."))
+        self.assertLess(own_modules_us, API_OWN_MODULES_BUDGET_US)
+
+
+CONCURRENT_FIRST_USE = """
+import threading
+import app.scraper as scraper
+
+barrier = threading.Barrier(16)
+errors = []
+
+def touch():
+    barrier.wait()
+    try:
+        scraper.requests.get
+        scraper.requests.RequestException
+    except Exception as exc:
+        errors.append(repr(exc))
+
+threads = [threading.Thread(target=touch) for _ in range(16)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert not errors, errors
+"""
+
+COLD_API_BURST = """
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+from fastapi.testclient import TestClient
+import app.main as main
+
+settings = MagicMock(supabase_url="http://127.0.0.1:9", supabase_service_key="key")
+client = TestClient(main.app)
+with patch.object(main, "settings", settings):
+    with ThreadPoolExecutor(max_workers=12) as pool:
+        statuses = list(pool.map(lambda i: client.get(f"/api/writeups?source=s{i}").status_code, range(12)))
+# Nothing listens on port 9, so every request must fail cleanly as a 502 (never a 500).
+assert statuses == [502] * 12, statuses
+"""
+
+
+class LazyImportConcurrencyTests(unittest.TestCase):
+    def _run_cold(self, script: str) -> None:
+        result = subprocess.run([sys.executable, "-c", script], cwd=BACKEND_DIR, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_concurrent_first_use_of_lazy_module(self):
+        for _ in range(3):
+            self._run_cold(CONCURRENT_FIRST_USE)
+
+    @unittest.skipUnless(FASTAPI_INSTALLED, "fastapi not installed in current environment")
+    def test_cold_api_handles_burst_of_first_requests(self):
+        self._run_cold(COLD_API_BURST)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,10 +11,47 @@ create table if not exists public.writeups (
   summary text,
   published_at timestamptz not null,
   created_at timestamptz not null default now(),
+  updated_at timestamptz not null default clock_timestamp(),
   is_favorite boolean not null default false,
-  is_read boolean not null default false
+  is_read boolean not null default false,
+  content_text text,
+  reading_time_minutes int,
+  tags text[] not null default '{}'
 );
 
+-- Article enrichment columns (for tables created before they existed)
+alter table public.writeups add column if not exists content_text text;
+alter table public.writeups add column if not exists reading_time_minutes int;
+alter table public.writeups add column if not exists tags text[] not null default '{}';
+
+-- Change tracking for delta sync (GET /api/writeups/changes)
+-- clock_timestamp() is the time of the write itself, not of the transaction start
+-- (now()), so a long transaction cannot commit rows stamped before an issued token.
+alter table public.writeups add column if not exists updated_at timestamptz not null default clock_timestamp();
+alter table public.writeups alter column updated_at set default clock_timestamp();
+
+create index if not exists writeups_updated_at_id_idx
+  on public.writeups (updated_at, id);
+
+-- Bump updated_at only when a row really changes, so the daily
+-- merge-duplicates upsert of unchanged rows does not show up as changes.
+create or replace function public.touch_writeups_updated_at()
+returns trigger
+language plpgsql
+as $$
+begin
+  if new is distinct from old then
+    new.updated_at := clock_timestamp();
+  end if;
+  return new;
+end;
+$$;
+
+drop trigger if exists writeups_touch_updated_at on public.writeups;
+create trigger writeups_touch_updated_at
+before update on public.writeups
+for each row execute function public.touch_writeups_updated_at();
+
 -- Composite index for source + date filtering/sorting
 create index if not exists writeups_source_published_at_idx
   on public.writeups (source, published_at desc);